@@ -6,10 +6,7 @@ Created on Fri Jun 7 2019
 
 """
 
-import os.path
-import pandas as pd
-
-import utilities.dataframes as dfs
+import importlib
 
 from specs.spec import Spec
 from specs.typespecs import CategorySpec, HistogramSpec
@@ -17,34 +14,41 @@ from specs.numspecs import NumSpec, RangeSpec
 
 __version__ = "1.0.0"
 __author__ = "Jack Kirby Cook"
-__all__ = ['specs_fromfile', 'CategorySpec', 'HistogramSpec', 'NumSpec', 'RangeSpec']
+__all__ = ['specs_fromfile', 'specs_fromfiles', 'SpecConflictError', 'specs_evaluate', 'specs_decode', 'specs_decodetable', 'specs_encodetable', 'SpecStream', 'SpecPool', 'SpecProfiler', 'SpecCatalog', 'SpecEngine', 'MovingWindow', 'SpecScaler', 'StandardScaler', 'MinMaxScaler', 'QuantileScaler', 'SpecBins', 'CategorySpec', 'HistogramSpec', 'NumSpec', 'RangeSpec', 'RangeDtype', 'RangeArray']
 __copyright__ = "Copyright 2018, Jack Kirby Cook"
 __license__ = ""
 
 
-_aslist = lambda items: [items] if not isinstance(items, (list, tuple)) else list(items)
-_defaultparser = lambda item: str(item) if pd.notnull(item) else item
-_allnull = lambda items: all([pd.isnull(item) for item in items])
-_allnotnull = lambda items: all([pd.notnull(item) for item in items])
-
-
-def specs_fromfile(specs_file, specs_parsers):
-    if not os.path.isfile(specs_file): raise FileNotFoundError(specs_file)
-    dataframe = dfs.dataframe_fromfile(specs_file)
-    dataframe = dfs.dataframe_parser(dataframe, parsers=specs_parsers, defaultparser=_defaultparser)
-    dataframe.set_index('datakey', drop=True, inplace=True)
-    specdata = {key:{item:value for item, value in values.items() if not _allnull(_aslist(value))} for key, values in dataframe.transpose().to_dict().items() if not _allnull(_aslist(values))}
-    return {key:Spec.fromfile(**values) for key, values in specdata.items()}
-    
-
-
-
-
-
-
-
-
-
-
+IMPORTS = {
+    'specs_fromfile':'specs.speccatalog', 
+    'specs_fromfiles':'specs.speccatalog', 
+    'SpecCatalog':'specs.speccatalog',
+    'SpecConflictError':'specs.speccatalog',
+    'specs_frombinary':'specs.specbinary', 
+    'specs_tobinary':'specs.specbinary',
+    'RangeDtype':'specs.specarrays', 
+    'RangeArray':'specs.specarrays',
+    'SpecEngine':'specs.specengine', 
+    'specs_evaluate':'specs.specengine',
+    'MovingWindow':'specs.speckernels',
+    'SpecScaler':'specs.specscalers', 
+    'StandardScaler':'specs.specscalers', 
+    'MinMaxScaler':'specs.specscalers', 
+    'QuantileScaler':'specs.specscalers',
+    'SpecBins':'specs.specbins',
+    'SpecStream':'specs.specstreams', 
+    'specs_decode':'specs.specstreams',
+    'SpecPool':'specs.specpools', 
+    'specs_decodetable':'specs.specpools', 
+    'specs_encodetable':'specs.specpools',
+    'SpecProfiler':'specs.specprofiles'}
+
+
+def __getattr__(name):
+    if name not in IMPORTS: raise AttributeError('module {} has no attribute {}'.format(__name__, name))
+    value = globals()[name] = getattr(importlib.import_module(IMPORTS[name]), name)
+    return value
+
+def __dir__(): return sorted(set(globals().keys()) | set(IMPORTS.keys()))
 
 
@@ -7,46 +7,102 @@ Created on Fri Apr 12 2018
 """
 
 import re
-import numpy as np
 from numbers import Number
 from functools import update_wrapper
 
 from utilities.quantities import Multiplier, Unit, Heading, MULTIPLIERS
 from utilities.dispatchers import keyword_singledispatcher as keyworddispatcher
 
+from specs.speclazy import LazyModule
 from specs.spec import Spec, SpecOperationNotSupportedError, SpecTransformationNotSupportedError
+from specs.speckernels import cumulate, uncumulate
+from specs.speccaches import LRUCache
 
 __version__ = "1.0.0"
 __author__ = "Jack Kirby Cook"
-__all__ = ['NumSpec', 'RangeSpec']
+__all__ = ['NumSpec', 'RangeSpec', 'NumConverter']
 __copyright__ = "Copyright 2018, Jack Kirby Cook"
 __license__ = ""
 
 
+np = LazyModule('numpy', owner=__name__, alias='np')
+pd = LazyModule('pandas', owner=__name__, alias='pd')
+
 INFINITY = '∞'
 DELIMITER = '|'
 ALL = DELIMITER.join(['-'+INFINITY, INFINITY])
 
+NUMPATTERN = r"[-+]?\d*\.\d+|\d+"
+NUMSTRPATTERN = r"^(?P<pre>.*?)(?P<num>" + NUMPATTERN + r")(?P<multiplier>.*)$"
 NUMFORMAT = 'num:.{precision}f'
+NUMSFORMAT = '%.{precision}f'
 NUMSTRFORMAT = '{numdirection}{heading}{numstr}{multiplier}{unit}'
 DIRECTIONS = {'upper':'>', 'lower':'<', 'state':'', 'unbounded':ALL, 'center':''}
+DIRECTIONCODES = {direction:code for code, direction in enumerate(DIRECTIONS.keys())}
 NUMDIRECTIONS = {'upper':'▲', 'lower':'▼', 'state':''}
+CONVERTERS = 1024
 DEFAULTS = {'numdirection':'state', 'heading':'', 'precision':0, 'unit':'', 'multiplier':''}
 
 _aslist = lambda items: [items] if not isinstance(items, (list, tuple)) else list(items)
+_asseries = lambda items: pd.Series(np.asarray(items.values if isinstance(items, pd.Series) else items, dtype=object).ravel())
+_asnums = lambda items: np.asarray(items.values if isinstance(items, pd.Series) else items, dtype=np.float64)
+_likeitems = lambda values, items: pd.Series(values, index=items.index) if isinstance(items, pd.Series) else values
+_isstrs = lambda items: np.asarray(items.values if isinstance(items, pd.Series) else items).dtype.kind in 'OUS'
+_isbounds = lambda items: isinstance(items, tuple) and len(items) == 2 and not any([isinstance(item, str) for item in items])
+_escape = lambda string: str(string).replace('{', '{{').replace('}', '}}')
 _fixnumtype = lambda num: None if num is None else int(float(num)) if not bool(float(num) % 1) else float(num)
 
 
 def _numfromstr(numstr):
     try: items, unit = numstr.split(' ')
     except: items, unit = numstr, ''
-    nums = re.findall(r"[-+]?\d*\.\d+|\d+", items)
-    if len(nums) == 0: return np.NaN
+    nums = re.findall(NUMPATTERN, items)
+    if len(nums) == 0: return np.nan
     elif len(nums) == 1:
         pre, multiplier = items.split(nums[0])
         return _fixnumtype(nums[0]) * MULTIPLIERS[multiplier]
     else: raise ValueError(nums)
 
+def _rangefromstr(rangestr):
+    nums = [_numfromstr(numstr) for numstr in rangestr.split(DELIMITER)]        
+    if DIRECTIONS['upper'] in rangestr: nums = (*nums, None)
+    elif DIRECTIONS['lower'] in rangestr: nums = (None, *nums)
+    elif DIRECTIONS['unbounded'] in rangestr: nums = (None, None)        
+    if len(nums) == 1: nums = (*nums, *nums)
+    assert len(nums) == 2
+    if None not in nums: nums = (min(nums), max(nums))
+    return nums
+
+def _rangedirection(value):
+    lowernum, uppernum = value
+    if all([x is None for x in value]): return 'unbounded'
+    elif lowernum is None: return 'lower'
+    elif uppernum is None: return 'upper'
+    elif lowernum == uppernum: return 'state'
+    else: return 'center' 
+
+def _numsfromstrs(numstrs, errors='raise'):
+    assert errors in ('raise', 'coerce')
+    numstrs = _asseries(numstrs)
+    nums = np.full(len(numstrs), np.nan, dtype=np.float64)
+    notnull = numstrs.notnull().values
+    numstrs = numstrs[notnull].astype(str)
+    splits = numstrs.str.split(' ')
+    items = numstrs.where(splits.str.len() != 2, splits.str[0])
+    counts = items.str.count(NUMPATTERN)
+    if errors == 'raise' and (counts > 1).any(): raise ValueError(items[counts > 1].tolist())
+    parts = items.str.extract(NUMSTRPATTERN)
+    multipliers = parts['multiplier'].map(MULTIPLIERS)
+    unknown = (counts == 1) & multipliers.isnull()
+    if errors == 'raise' and unknown.any(): raise KeyError(parts['multiplier'][unknown].unique().tolist())
+    nums[notnull] = np.where(counts.values > 1, np.nan, parts['num'].astype(np.float64).values * multipliers.astype(np.float64).values)
+    return nums, np.isnan(nums)
+
+def _numsoverflow(nums, *args, precision, multiplier, **kwargs):
+    scaled = nums / multiplier.num
+    with np.errstate(invalid='ignore'):
+        return np.isfinite(scaled) & ~np.isclose(np.round(scaled, int(precision)), scaled, rtol=1e-9, atol=1e-9)
+
 def _numformatting(num, *args, precision, nummultiplier, **kwargs):
     assert isinstance(num, Number)
     assert isinstance(precision, int)
@@ -62,10 +118,93 @@ def _numstrformatting(num, *args, heading, multiplier, unit, numdirection, **kwa
     numstr = _numformatting(num, *args, nummultiplier=multiplier.num, **kwargs)
     return NUMSTRFORMAT.format(numstr=numstr, heading=str(heading), multiplier=str(multiplier), unit=str(unit), numdirection=NUMDIRECTIONS[numdirection], **kwargs)
 
+def _numsformatting(nums, *args, precision, nummultiplier, **kwargs):
+    assert isinstance(precision, int)
+    assert isinstance(nummultiplier, Number)
+    return np.char.mod(NUMSFORMAT.format(precision=precision), nums / nummultiplier)
+
+def _numstrsformatting(nums, *args, heading, multiplier, unit, numdirection, **kwargs):
+    assert isinstance(multiplier, Multiplier)
+    assert isinstance(unit, Unit)
+    assert isinstance(heading, Heading)
+    numstrs = _numsformatting(nums, *args, nummultiplier=multiplier.num, **kwargs)
+    return np.char.add(np.char.add(NUMDIRECTIONS[numdirection] + str(heading), numstrs), str(multiplier) + str(unit))
+
+def _numencoder(*args, heading, multiplier, unit, numdirection, precision, **kwargs):
+    numstr = '{' + NUMFORMAT.format(precision=int(precision)) + '}'
+    numstrformat = NUMSTRFORMAT.format(numstr=numstr, heading=_escape(heading), multiplier=_escape(multiplier), unit=_escape(unit), numdirection=NUMDIRECTIONS[numdirection])
+    nummultiplier = multiplier.num
+    return lambda num: ALL if num is None else numstrformat.format(num=num/nummultiplier)
+
+def _rangeencoder(*args, **kwargs):
+    numencoder = _numencoder(*args, **kwargs)
+    def encoder(value):
+        direction = _rangedirection(value)
+        if direction == 'state': return DIRECTIONS[direction] + numencoder(value[0])
+        else: return DIRECTIONS[direction] + DELIMITER.join([numencoder(num) for num in value if num is not None])
+    return encoder
+
 def _rangestrformatting(lowernum, uppernum, *args, **kwargs):
     return DELIMITER.join([_numformatting(lowernum, *args, **kwargs), _numformatting(uppernum, *args, **kwargs)])
 
 
+def _rangesfromstrs(rangestrs, errors='raise'):
+    assert errors in ('raise', 'coerce')
+    rangestrs = _asseries(rangestrs)
+    lowers, uppers = np.full(len(rangestrs), np.nan, dtype=np.float64), np.full(len(rangestrs), np.nan, dtype=np.float64)
+    notnull = rangestrs.notnull().values
+    rangestrs = rangestrs[notnull].astype(str)
+    numstrs = rangestrs.str.split(DELIMITER)
+    counts = numstrs.str.len().values
+    if errors == 'raise' and (counts > 2).any(): raise ValueError(rangestrs[counts > 2].tolist())
+    upper = rangestrs.str.contains(DIRECTIONS['upper'], regex=False).values
+    lower = ~upper & rangestrs.str.contains(DIRECTIONS['lower'], regex=False).values
+    unbounded = ~upper & ~lower & rangestrs.str.contains(DIRECTIONS['unbounded'], regex=False).values
+    if errors == 'raise' and ((upper | lower) & (counts != 1)).any(): raise ValueError(rangestrs[(upper | lower) & (counts != 1)].tolist())
+    firsts, _ = _numsfromstrs(numstrs.str[0], errors=errors)
+    seconds, _ = _numsfromstrs(numstrs.str[1].where(counts == 2, numstrs.str[0]), errors=errors)
+    lowernums, uppernums = np.fmin(firsts, seconds), np.fmax(firsts, seconds)
+    lowernums[lower | unbounded], uppernums[upper | unbounded] = -np.inf, np.inf
+    lowernums[upper], uppernums[lower] = firsts[upper], firsts[lower]
+    if errors == 'coerce':
+        malformed = (counts > 2) | ((upper | lower) & (counts != 1)) | (~unbounded & (np.isnan(firsts) | np.isnan(seconds)))
+        lowernums[malformed], uppernums[malformed] = np.nan, np.nan
+    lowers[notnull], uppers[notnull] = lowernums, uppernums
+    return lowers, uppers, _rangedirections(lowers, uppers)
+
+def _rangesreversed(rangestrs):
+    rangestrs = _asseries(rangestrs)
+    reversed = np.zeros(len(rangestrs), dtype=bool)
+    notnull = rangestrs.notnull().values
+    numstrs = rangestrs[notnull].astype(str).str.split(DELIMITER)
+    paired = (numstrs.str.len() == 2).values
+    firsts, _ = _numsfromstrs(numstrs.str[0].where(paired), errors='coerce')
+    seconds, _ = _numsfromstrs(numstrs.str[1].where(paired), errors='coerce')
+    reversed[notnull] = firsts > seconds
+    return reversed
+
+def _rangedirections(lowers, uppers):
+    directions = np.full(lowers.shape, DIRECTIONCODES['center'], dtype=np.int8)
+    directions[lowers == uppers] = DIRECTIONCODES['state']
+    directions[np.isneginf(lowers)] = DIRECTIONCODES['lower']
+    directions[np.isposinf(uppers)] = DIRECTIONCODES['upper']
+    directions[np.isneginf(lowers) & np.isposinf(uppers)] = DIRECTIONCODES['unbounded']
+    directions[np.isnan(lowers) | np.isnan(uppers)] = -1
+    return directions
+
+def _rangestrsformatting(lowers, uppers, *args, **kwargs):
+    directions = _rangedirections(lowers, uppers)
+    lowerstrs, upperstrs = _numstrsformatting(lowers, *args, **kwargs), _numstrsformatting(uppers, *args, **kwargs)
+    rangestrs = {'upper': np.char.add(DIRECTIONS['upper'], lowerstrs),
+                 'lower': np.char.add(DIRECTIONS['lower'], upperstrs),
+                 'state': lowerstrs,
+                 'unbounded': np.full(lowers.shape, DIRECTIONS['unbounded']),
+                 'center': np.char.add(np.char.add(lowerstrs, DELIMITER), upperstrs)}
+    strings = np.full(lowers.shape, np.nan, dtype=object)
+    for direction, code in DIRECTIONCODES.items(): strings[directions == code] = rangestrs[direction][directions == code]
+    return strings, directions < 0
+
+
 def _formatting(function):
     def wrapper(*args, formatting={}, **kwargs):
         kwargs.update(formatting)
@@ -74,9 +213,49 @@ def _formatting(function):
     return wrapper
 
 
+class NumConverter(object):
+    def __init__(self, source, target):
+        if source.datatype != target.datatype: raise SpecOperationNotSupportedError(source, target, 'convert')
+        if str(source.unit) != str(target.unit) or str(source.heading) != str(target.heading): raise SpecOperationNotSupportedError(source, target, 'convert')
+        self.__source, self.__target = source, target
+        self.__sourcenum, self.__targetnum = source.multiplier.num, target.multiplier.num
+        self.__precision = int(target.precision)
+
+    @property
+    def source(self): return self.__source
+    @property
+    def target(self): return self.__target
+    @property
+    def factor(self): return self.__sourcenum / self.__targetnum
+    def __repr__(self): return '{}({} -> {}, factor={})'.format(self.__class__.__name__, self.source.name, self.target.name, self.factor)
+
+    def __call__(self, values):
+        if isinstance(values, tuple): return tuple([self(items) for items in values])
+        nums = self.__rounded(np.divide(_asnums(values), self.__targetnum))
+        return _likeitems(np.multiply(nums, self.__targetnum), values)
+
+    def todisplay(self, values):
+        if isinstance(values, tuple): return tuple([self.todisplay(items) for items in values])
+        return _likeitems(self.__rounded(np.divide(_asnums(values), self.__targetnum)), values)
+    def fromdisplay(self, values):
+        if isinstance(values, tuple): return tuple([self.fromdisplay(items) for items in values])
+        return _likeitems(np.multiply(_asnums(values), self.__sourcenum), values)
+    def rebase(self, values):
+        if isinstance(values, tuple): return tuple([self.rebase(items) for items in values])
+        return _likeitems(self.__rounded(np.multiply(_asnums(values), self.factor)), values)
+
+    def __rounded(self, nums): return np.round(nums, self.__precision)
+
+
 class NumSpec(Spec, datatype='num'):  
-    def __hash__(self): return hash((self.data, self.datatype, self.unit,))
+    __slots__ = ('__heading', '__numdirection', '__multiplier', '__unit', '__precision')
+    __converters = LRUCache(size=CONVERTERS)
+    __hash__ = Spec.__hash__
+
+    @property
+    def hashkey(self): return (self.data, self.datatype, self.unit,)
     def __eq__(self, other): 
+        if self is other: return True
         if type(self) != type(other): raise TypeError(type(other).__name__)
         if all([self.data != other.data, self.datatype != other.datatype]): raise TypeError(type(other).__name__)
         return self.unit == other.unit
@@ -104,13 +283,39 @@ class NumSpec(Spec, datatype='num'):
         super().__init__(*args, **kwargs)
 
     def todict(self): return dict(**super().todict(), multiplier=self.multiplier, unit=self.unit, heading=self.heading, precision=self.precision, numdirection=self.numdirection)  
-    def asval(self, string): return _numfromstr(string)
-    def asstr(self, value): return _numstrformatting(value, **self.todict())       
+    def decoder(self): return _numfromstr
+    def encoder(self): return _numencoder(**self.todict())
+    def asval(self, string): return self.valdecoder()(string)
+    def asstr(self, value): return self.valencoder()(value)
+
+    def converter(self, other):
+        converter = self.__converters.get((self.key, other.key), None)
+        if converter is None: converter = self.__converters.put((self.key, other.key), NumConverter(self, other))
+        return converter
+    def convert(self, values, other): return self.converter(other)(values)
+
+    def asvals(self, strings): 
+        nums, mask = _numsfromstrs(strings)
+        return _likeitems(nums, strings), _likeitems(mask, strings)
+    
+    def asstrs(self, values): 
+        nums = _asnums(values)
+        numstrs, mask = _numstrsformatting(nums, **self.todict()).astype(object), np.isnan(nums)
+        numstrs[mask] = np.nan
+        return _likeitems(numstrs, values), _likeitems(mask, values)
+
+    def validations(self, values):
+        if not _isstrs(values): 
+            nums = _asnums(values)
+            return np.isnan(nums), dict(precision=_numsoverflow(nums, **self.todict()))
+        nums, mask = _numsfromstrs(values, errors='coerce')
+        nulls = _asseries(values).isnull().values
+        return nulls, dict(unparsable=~nulls & mask, precision=_numsoverflow(nums, **self.todict()))
 
     @classmethod
     def fromfile(cls, *args, databasis={}, **kwargs):
         assert isinstance(databasis, dict)
-        formatting = {key:databasis.pop(key, value) for key, value in DEFAULTS.items()}
+        formatting = {key:databasis.get(key, value) for key, value in DEFAULTS.items()}
         return cls(*args, **formatting, **kwargs)
     
     # OPERATIONS
@@ -165,9 +370,9 @@ class NumSpec(Spec, datatype='num'):
     def groupby(self, *args, how, **kwargs): raise KeyError(how)
     @groupby.register('bins')
     def __bins(self, *args, how, **kwargs): return self.transformation(*args, datatype='range', method='groupby', how='bins', **kwargs) 
-    @groupby.register('bins')
+    @groupby.register('overlaps')
     def __overlaps(self, *args, how, **kwargs): return self.transformation(*args, datatype='range', method='groupby', how='overlaps', **kwargs)  
-    @groupby.register('bins')
+    @groupby.register('contains')
     def __contains(self, *args, how, **kwargs): return self.transformation(*args, datatype='range', method='groupby', how='contains', **kwargs)      
     
     @keyworddispatcher('how')
@@ -177,34 +382,44 @@ class NumSpec(Spec, datatype='num'):
         assert direction == 'lower' or direction == 'upper'
         assert direction == self.numdirection
         return self.transformation(*args, datatype='range', method='unconsolidate', how='cumulate', direction=direction, numdirection='state', **kwargs)
+
+    def uncumulate(self, values, *args, axis=-1, **kwargs): 
+        spec = self.unconsolidate(*args, how='cumulate', direction=self.numdirection, **kwargs)
+        return uncumulate(values, direction=self.numdirection, axis=axis), spec
     
    
 class RangeSpec(NumSpec, datatype='range'):
-    def direction(self, value):
-        lowernum, uppernum = value
-        if all([x is None for x in value]): return 'unbounded'
-        elif lowernum is None: return 'lower'
-        elif uppernum is None: return 'upper'
-        elif lowernum == uppernum: return 'state'
-        else: return 'center' 
-
-    def asval(self, string):
-        nums = [_numfromstr(numstr) for numstr in string.split(DELIMITER)]        
-        if DIRECTIONS['upper'] in string: nums = (*nums, None)
-        elif DIRECTIONS['lower'] in string: nums = (None, *nums)
-        elif DIRECTIONS['unbounded'] in string: nums = (None, None)        
-        if len(nums) == 1: nums = (*nums, *nums)
-        assert len(nums) == 2
-        if None not in nums: nums = (min(nums), max(nums))
-        return nums
-
-    def asstr(self, value):   
-        if self.direction(value) == 'state': rangestr = _numstrformatting(value[0], **self.todict())    
-        else: rangestr = DELIMITER.join([_numstrformatting(num, **self.todict()) for num in value if num is not None])   
-        return DIRECTIONS[self.direction(value)] + rangestr
+    __slots__ = ()
+
+    def direction(self, value): return _rangedirection(value)
+
+    def directions(self, lowers, uppers): return _likeitems(_rangedirections(_asnums(lowers), _asnums(uppers)), lowers)
+
+    def decoder(self): return _rangefromstr
+    def encoder(self): return _rangeencoder(**self.todict())
+
+    def asvals(self, strings):
+        lowers, uppers, directions = _rangesfromstrs(strings)
+        return _likeitems(lowers, strings), _likeitems(uppers, strings), _likeitems(directions, strings)
+
+    def asstrs(self, lowers, uppers):
+        rangestrs, mask = _rangestrsformatting(_asnums(lowers), _asnums(uppers), **self.todict())
+        return _likeitems(rangestrs, lowers), _likeitems(mask, lowers)
+
+    def validations(self, values):
+        if isinstance(values, pd.Series) and not _isstrs(values): values = values.array
+        if _isbounds(values) or hasattr(values, 'lowers'):
+            lowers, uppers = (_asnums(values.lowers), _asnums(values.uppers)) if hasattr(values, 'lowers') else (_asnums(values[0]), _asnums(values[1]))
+            nulls = np.isnan(lowers) | np.isnan(uppers)
+            return nulls, dict(reversed=lowers > uppers, precision=_numsoverflow(lowers, **self.todict()) | _numsoverflow(uppers, **self.todict()))
+        lowers, uppers, directions = _rangesfromstrs(values, errors='coerce')
+        nulls = _asseries(values).isnull().values
+        unparsable = ~nulls & (np.isnan(lowers) | np.isnan(uppers))
+        return nulls, dict(unparsable=unparsable, reversed=_rangesreversed(values), precision=_numsoverflow(lowers, **self.todict()) | _numsoverflow(uppers, **self.todict()))
    
     # TRANSFORMATIONS    
     def unconsolidate(self, *args, **kwargs): raise NotImplementedError('{}.{}()'.format(self.__class__.__name__, 'unconsolidate'))
+    def uncumulate(self, *args, **kwargs): raise NotImplementedError('{}.{}()'.format(self.__class__.__name__, 'uncumulate'))
 
     def split(self, *args, **kwargs): return self.transformation(*args, datatype='range', method='split', **kwargs)
     def expand(self, *args, **kwargs): return self.transformation(*args, datatype='num', method='expand', **kwargs)
@@ -224,11 +439,8 @@ class RangeSpec(NumSpec, datatype='range'):
     def __differential(self, *args, how, **kwargs):
         return self.transformation(*args, datatype='num', method='consolidate', how='differential', **kwargs)
 
-    
-
-
-
-
-
+    def cumulate(self, values, *args, direction, axis=-1, **kwargs): 
+        spec = self.consolidate(*args, how='cumulate', direction=direction, **kwargs)
+        return cumulate(values, direction=direction, axis=axis), spec
 
 
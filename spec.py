@@ -7,11 +7,16 @@ Created on Fri Apr 12 2018
 """
 
 import os.path
-from abc import ABC, abstractmethod
+import weakref
+from abc import ABC, ABCMeta, abstractmethod
+from numbers import Number
 import json
 from utilities.strings import uppercase
 
-from specs.specdata import data_operation, data_transformation
+from specs.speclazy import LazyModule
+from specs.specdata import data_operation, data_transformation, data_tojson, data_fromjson, SpecData
+from specs.speccodecs import SpecCodec, _valuekey
+from specs.speccaches import DerivationCache
 
 __version__ = "1.0.0"
 __author__ = "Jack Kirby Cook"
@@ -20,34 +25,121 @@ __copyright__ = "Copyright 2018, Jack Kirby Cook"
 __license__ = ""
 
 
+np = LazyModule('numpy', owner=__name__, alias='np')
+pd = LazyModule('pandas', owner=__name__, alias='pd')
+
+DERIVATIONS = 4096
+
 class SpecOperationNotSupportedError(Exception): 
     def __init__(self, spec, other, operation): super().__init__('{}.{}({})'.format(repr(spec), operation, repr(other)))
 class SpecTransformationNotSupportedError(Exception):
     def __init__(self, spec, transformation, method): super().__init__('{}.{}(method={})'.format(repr(spec), transformation, method))   
     
+
+_jsondefault = lambda value: data_tojson(value) if isinstance(value, SpecData) else str(value)
+_internkey = lambda value: _valuekey(value) if isinstance(value, (str, Number, tuple, SpecData, type(None))) else str(value)
+
+
+def _restore(attrs): return Spec(**attrs)
+
+def _derivationkey(value):
+    if isinstance(value, Spec): return value.key
+    if isinstance(value, dict): return tuple([(key, _derivationkey(item)) for key, item in sorted(value.items())])
+    if isinstance(value, (list, tuple)): return tuple([_derivationkey(item) for item in value])
+    return _internkey(value)
+
+
+def _aliasvalue(value):
+    if type(value) in (str, type(None)): return value
+    if type(value) in (int, bool): return (type(value), value)
+    if isinstance(value, (Number, SpecData)): return _valuekey(value)
+    if isinstance(value, (list, tuple)): return (type(value), *[_aliasvalue(item) for item in value])
+    if isinstance(value, dict): return (dict, *sorted([(key, _aliasvalue(item)) for key, item in value.items()], key=repr))
+    if type(value).__eq__ is object.__eq__: raise TypeError(type(value).__name__)
+    hash(value)
+    return (type(value), value)
+
+def _aliaskey(cls, args, kwargs):
+    if args: return None
+    try: return (cls, tuple([(key, _aliasvalue(value)) for key, value in sorted(kwargs.items())]))
+    except TypeError: return None
+
+
+class SpecMeta(ABCMeta):
+    def __call__(cls, *args, **kwargs):
+        if cls is Spec: return cls.registry()[kwargs['datatype'].lower()](*args, **kwargs)
+        alias = _aliaskey(cls, args, kwargs)
+        spec = cls.aliased(alias) if alias is not None else None
+        if spec is not None: return spec
+        return cls.intern(super().__call__(*args, **kwargs), alias=alias)
+
     
-class Spec(ABC):
+class Spec(ABC, metaclass=SpecMeta):
+    __slots__ = ('__data', '__key', '__hash', '__caches', '__weakref__')
     __registry = {}
+    __interned = weakref.WeakValueDictionary()
+    __aliases = weakref.WeakValueDictionary()
+    __derivations = DerivationCache(size=DERIVATIONS)
     @classmethod
     def registry(cls): return cls.__registry
+    @classmethod
+    def derivations(cls): return cls.__derivations
+    @classmethod
+    def interned(cls): return cls.__interned
+    @classmethod
+    def aliased(cls, alias): return cls.__aliases.get(alias, None)
+    @classmethod
+    def intern(cls, spec, *args, alias=None, **kwargs):
+        spec = cls.__interned.setdefault(spec.key, spec)
+        if alias is not None: cls.__aliases[alias] = spec
+        return spec
     def __init_subclass__(cls, *args, datatype, **kwargs):
         setattr(cls, 'datatype', datatype.lower())
         cls.__registry[datatype] = cls
 
-    def __init__(self, *args, data, **kwargs): self.__data = data
-    def __new__(cls, *args, **kwargs):
-        if cls == Spec: return cls.__registry[kwargs['datatype'].lower()](*args, **kwargs)
-        else: return super().__new__(cls)
+    def __init__(self, *args, data, **kwargs): 
+        self.__data = data_fromjson(data)
+        self.__caches = {}
+        self.__key = (self.__class__, tuple([(key, _internkey(value)) for key, value in sorted(self.todict().items())]),)
+        self.__hash = hash(self.hashkey)
+
+    def __setattr__(self, attr, value):
+        if hasattr(self, attr): raise AttributeError('{}.{}'.format(self.__class__.__name__, attr))
+        super().__setattr__(attr, value)
+    def __delattr__(self, attr): raise AttributeError('{}.{}'.format(self.__class__.__name__, attr))
+    def __reduce__(self): return (_restore, (self.todict(),))
+    def __hash__(self): return self.__hash
 
     @property
     def data(self): return self.__data
     @property
-    def dataname(self): return uppercase(self.__data, withops=True)
+    def key(self): return self.__key
+    @property
+    def dataname(self): return self.cached('dataname', lambda: uppercase(str(self.__data), withops=True))
     @property
     def name(self): return '_'.join([self.dataname, uppercase(self.datatype, withops=True), 'Spec'])        
     
-    def jsonstr(self): return json.dumps(self.todict(), sort_keys=True, indent=3, separators=(',', ' : '), default=str)  
+    def jsonstr(self): return json.dumps(self.todict(), sort_keys=True, indent=3, separators=(',', ' : '), default=_jsondefault)  
     def todict(self): return dict(data=self.data, datatype=self.datatype)    
+
+    def cached(self, key, function):
+        if key not in self.__caches: self.__caches[key] = function()
+        return self.__caches[key]
+
+    def decoder(self): return self.asval
+    def encoder(self): return self.asstr
+    def codec(self, *args, size=None, **kwargs):
+        codec = self.__caches.get('codec', None)
+        if codec is None or (size is not None and size != codec.size): 
+            codec = self.__caches['codec'] = SpecCodec(self.decoder(), self.encoder(), size=size if size is not None else 0)
+            self.__caches['valdecoder'], self.__caches['valencoder'] = (codec.asval, codec.asstr) if codec.size else (self.decoder(), self.encoder())
+        return codec
+    def valdecoder(self):
+        if 'valdecoder' not in self.__caches: self.codec()
+        return self.__caches['valdecoder']
+    def valencoder(self):
+        if 'valencoder' not in self.__caches: self.codec()
+        return self.__caches['valencoder']
     
     def __add__(self, other): return self.add(other)
     def __sub__(self, other): return self.subtract(other)
@@ -63,27 +155,46 @@ class Spec(ABC):
     def asstr(value): pass
     @abstractmethod
     def __eq__(self, other): pass
+    @property
+    @abstractmethod
+    def hashkey(self): pass 
     @abstractmethod
-    def __hash__(self): pass 
+    def validations(self, values): pass
+
+    def validate(self, values):
+        nulls, invalids = self.validations(values)
+        mask = np.zeros(nulls.shape, dtype=bool)
+        for invalid in invalids.values(): mask |= invalid
+        summary = dict(total=int(nulls.size), nulls=int(np.sum(nulls)), invalid=int(np.sum(mask)), **{reason:int(np.sum(invalid)) for reason, invalid in invalids.items()})
+        return (pd.Series(mask, index=values.index) if isinstance(values, pd.Series) else mask), summary
 
     # OPERATIONS
     def operation(self, other, *args, method, **kwargs):
+        key = ('operation', self.key, _derivationkey(other), _derivationkey(args), method, _derivationkey(kwargs),)
+        return self.__derivations.derive(key, method, lambda: self.__operation(other, *args, method=method, **kwargs))
+
+    def __operation(self, other, *args, method, **kwargs):
         datatype = kwargs.get('datatype', self.datatype)
         attrs = {key:kwargs.get(key, value) for key, value in self.todict().items()}
         attrs['data'] = data_operation(self.data, other.data, *args, method=method, **kwargs)
-        return self.registry[datatype](**attrs)        
+        return self.registry()[datatype](**attrs)        
     
     # TRANSFORMATIONS
-    def transformation(self, *args, method, how, **kwargs):
+    def transformation(self, *args, method, how=None, **kwargs):
+        key = ('transformation', self.key, _derivationkey(args), method, how, _derivationkey(kwargs),)
+        return self.__derivations.derive(key, ':'.join([method, str(how)]), lambda: self.__transformation(*args, method=method, how=how, **kwargs))
+
+    def __transformation(self, *args, method, how, **kwargs):
         datatype = kwargs.get('datatype', self.datatype)
         attrs = {key:kwargs.get(key, value) for key, value in self.todict().items()}
+        if datatype != self.datatype: attrs.update({key:value for key, value in kwargs.items() if key not in attrs})
         attrs['data'] = data_transformation(self.data, *args, method=method, how=how, **kwargs)
-        return self.registry[datatype](**attrs)   
+        return self.registry()[datatype](**attrs)   
         
     # FILES
     def tojson(self, file):
         with open(file, 'w') as outfile:          
-            json.dump(self.todict(), outfile, sort_keys=True, indent=3, separators=(',', ' : '))    
+            json.dump(self.todict(), outfile, sort_keys=True, indent=3, separators=(',', ' : '), default=_jsondefault)    
     
     @classmethod
     def fromjson(cls, file):
@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Oct 17 2026
+@name:   SpecArray Objects
+@author: Jack Kirby Cook
+
+"""
+
+import numpy as np
+import pandas as pd
+from numbers import Number
+from pandas.api.extensions import ExtensionDtype, ExtensionArray, register_extension_dtype, take
+
+from specs.numspecs import RangeSpec, _rangedirections
+
+__version__ = "1.0.0"
+__author__ = "Jack Kirby Cook"
+__all__ = ['RangeDtype', 'RangeArray']
+__copyright__ = "Copyright 2018, Jack Kirby Cook"
+__license__ = ""
+
+
+_isnull = lambda value: value is None or (isinstance(value, Number) and np.isnan(value))
+_samespec = lambda spec, other: spec is other or (spec is not None and other is not None and spec.todict() == other.todict())
+_fromnum = lambda num, bound: bound if num is None else np.float64(num)
+_fixnumtype = lambda num: int(num) if not bool(num % 1) else float(num)
+_tonum = lambda num: None if np.isinf(num) else _fixnumtype(num)
+
+
+def _fromrange(value):
+    if _isnull(value): return np.nan, np.nan
+    lowernum, uppernum = value
+    return _fromnum(lowernum, -np.inf), _fromnum(uppernum, np.inf)
+
+def _torange(lowernum, uppernum):
+    if np.isnan(lowernum) or np.isnan(uppernum): return np.nan
+    return _tonum(lowernum), _tonum(uppernum)
+
+
+@register_extension_dtype
+class RangeDtype(ExtensionDtype):
+    type = tuple
+    kind = 'O'
+    na_value = np.nan
+    _metadata = ('spec',)
+
+    def __init__(self, spec=None):
+        assert spec is None or isinstance(spec, RangeSpec)
+        self.__spec = spec
+
+    @property
+    def spec(self): return self.__spec
+    @property
+    def name(self): return 'range' if self.spec is None else 'range[{}]'.format(str(self.spec.data))
+
+    def __hash__(self): return hash((self.__class__.__name__, self.name,))
+    def __eq__(self, other):
+        if isinstance(other, str): return other == self.name
+        return isinstance(other, RangeDtype) and _samespec(self.spec, other.spec)
+
+    @classmethod
+    def construct_array_type(cls): return RangeArray
+    @classmethod
+    def construct_from_string(cls, string):
+        if not isinstance(string, str): raise TypeError(type(string).__name__)
+        if string == 'range': return cls()
+        raise TypeError("Cannot construct a '{}' from '{}'".format(cls.__name__, string))
+
+
+class RangeArray(ExtensionArray):
+    __array_priority__ = 1000
+
+    @property
+    def dtype(self): return self.__dtype
+    @property
+    def spec(self): return self.__dtype.spec
+    @property
+    def lowers(self): return self.__lowers
+    @property
+    def uppers(self): return self.__uppers
+    @property
+    def nbytes(self): return self.__lowers.nbytes + self.__uppers.nbytes
+
+    def __init__(self, lowers, uppers, dtype=None, copy=False):
+        self.__lowers = np.array(lowers, dtype=np.float64) if copy else np.asarray(lowers, dtype=np.float64)
+        self.__uppers = np.array(uppers, dtype=np.float64) if copy else np.asarray(uppers, dtype=np.float64)
+        assert self.__lowers.ndim == self.__uppers.ndim == 1 and self.__lowers.shape == self.__uppers.shape
+        self.__dtype = dtype if isinstance(dtype, RangeDtype) else RangeDtype()
+
+    def __len__(self): return len(self.__lowers)
+    def __iter__(self): return (_torange(lowernum, uppernum) for lowernum, uppernum in zip(self.__lowers, self.__uppers))
+    def __getitem__(self, item):
+        if isinstance(item, (int, np.integer)): return _torange(self.__lowers[item], self.__uppers[item])
+        item = pd.api.indexers.check_array_indexer(self, item)
+        return self.__class__(self.__lowers[item], self.__uppers[item], dtype=self.dtype)
+
+    def __setitem__(self, item, value):
+        if not isinstance(item, (int, np.integer)): item = pd.api.indexers.check_array_indexer(self, item)
+        if isinstance(value, RangeArray): self.__lowers[item], self.__uppers[item] = value.lowers, value.uppers
+        elif isinstance(value, tuple) or _isnull(value): self.__lowers[item], self.__uppers[item] = _fromrange(value)
+        else: raise TypeError(type(value).__name__)
+
+    def __eq__(self, other):
+        if isinstance(other, (pd.Series, pd.Index, pd.DataFrame)): return NotImplemented
+        if isinstance(other, RangeArray): lowers, uppers = other.lowers, other.uppers
+        elif isinstance(other, tuple): lowers, uppers = _fromrange(other)
+        else: return np.zeros(len(self), dtype=bool)
+        return (self.__lowers == lowers) & (self.__uppers == uppers)
+
+    def __array__(self, dtype=None, copy=None):
+        values = np.empty(len(self), dtype=object)
+        values[:] = list(iter(self))
+        return values
+
+    def isna(self): return np.isnan(self.__lowers) | np.isnan(self.__uppers)
+    def copy(self): return self.__class__(self.__lowers, self.__uppers, dtype=self.dtype, copy=True)
+    def directions(self): return _rangedirections(self.__lowers, self.__uppers)
+    def asstrs(self):
+        if self.spec is None: raise ValueError(self.dtype.name)
+        rangestrs, mask = self.spec.asstrs(self.__lowers, self.__uppers)
+        return rangestrs
+
+    def take(self, indices, *args, allow_fill=False, fill_value=None, **kwargs):
+        lowerfill, upperfill = _fromrange(fill_value)
+        lowers = take(self.__lowers, indices, allow_fill=allow_fill, fill_value=lowerfill)
+        uppers = take(self.__uppers, indices, allow_fill=allow_fill, fill_value=upperfill)
+        return self.__class__(lowers, uppers, dtype=self.dtype)
+
+    def _values_for_factorize(self):
+        values = np.empty(len(self), dtype=np.complex128)
+        values.real, values.imag = self.__lowers, self.__uppers
+        return values, np.nan + 1j * np.nan
+    def _values_for_argsort(self): return self._values_for_factorize()[0]
+
+    def _formatter(self, boxed=False):
+        if self.spec is None: return repr
+        return lambda value: self.spec.asstr(value) if isinstance(value, tuple) else str(value)
+
+    @classmethod
+    def _from_factorized(cls, values, original): return cls(values.real, values.imag, dtype=original.dtype)
+    @classmethod
+    def _concat_same_type(cls, to_concat):
+        lowers = np.concatenate([array.lowers for array in to_concat])
+        uppers = np.concatenate([array.uppers for array in to_concat])
+        return cls(lowers, uppers, dtype=to_concat[0].dtype)
+
+    @classmethod
+    def _from_sequence(cls, scalars, *args, dtype=None, copy=False, **kwargs):
+        dtype = pd.api.types.pandas_dtype(dtype) if dtype is not None else RangeDtype()
+        if isinstance(scalars, RangeArray): return cls(scalars.lowers, scalars.uppers, dtype=dtype, copy=copy)
+        if all([isinstance(scalar, str) or _isnull(scalar) for scalar in scalars]) and dtype.spec is not None:
+            return cls._from_sequence_of_strings(scalars, dtype=dtype)
+        bounds = np.array([_fromrange(scalar) for scalar in scalars], dtype=np.float64).reshape(-1, 2)
+        return cls(bounds[:, 0], bounds[:, 1], dtype=dtype)
+
+    @classmethod
+    def _from_sequence_of_strings(cls, strings, *args, dtype=None, copy=False, **kwargs):
+        dtype = pd.api.types.pandas_dtype(dtype) if dtype is not None else RangeDtype()
+        if dtype.spec is None: raise ValueError(dtype.name)
+        lowers, uppers, directions = dtype.spec.asvals(np.asarray(strings, dtype=object))
+        return cls(lowers, uppers, dtype=dtype)
+
+    @classmethod
+    def fromstrs(cls, strings, spec): return cls._from_sequence_of_strings(strings, dtype=RangeDtype(spec))
+    @classmethod
+    def fromvals(cls, values, spec): return cls._from_sequence(values, dtype=RangeDtype(spec))
+
+
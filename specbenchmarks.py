@@ -0,0 +1,219 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Oct 17 2026
+@name:   SpecBenchmark Objects
+@author: Jack Kirby Cook
+
+"""
+
+import os
+import sys
+import json
+import time
+import platform
+import argparse
+import tempfile
+import subprocess
+from abc import ABCMeta
+import numpy as np
+import pandas as pd
+
+__version__ = "1.0.0"
+__author__ = "Jack Kirby Cook"
+__all__ = ['SpecBenchmark', 'BENCHMARKS']
+__copyright__ = "Copyright 2018, Jack Kirby Cook"
+__license__ = ""
+
+
+SIZES = (1000, 10000)
+REPEAT = 5
+THRESHOLD = 0.25
+DATATYPES = ('num', 'range', 'category', 'histogram')
+CATEGORIES = ('red', 'green', 'blue', 'black', 'white')
+HEAVY = ('numpy', 'pandas', 'utilities.dataframes')
+PARSERS = {'databasis':lambda item: json.loads(item) if isinstance(item, str) else item}
+BENCHMARKS = {}
+
+
+def _benchmark(name):
+    def decorator(function):
+        BENCHMARKS[name] = function
+        return function
+    return decorator
+
+
+def _synthetic_attrs(size):
+    databasis = {
+        'num':lambda index: dict(precision=index % 3, multiplier=['', 'K', 'M'][index % 3], unit=['', '$'][index % 2]),
+        'range':lambda index: dict(precision=index % 2, multiplier=['', 'K'][index % 2], unit='$'),
+        'category':lambda index: [item for position, category in enumerate(CATEGORIES) for item in (category, position)],
+        'histogram':lambda index: [item for position, category in enumerate(CATEGORIES) for item in (category, position)]}
+    datatype = lambda index: DATATYPES[index % len(DATATYPES)]
+    return [dict(datakey='key{}'.format(index), data='data{}'.format(index), datatype=datatype(index), databasis=databasis[datatype(index)](index)) for index in range(size)]
+
+def _synthetic_specs(size):
+    from specs.spec import Spec
+    return {attrs['datakey']:Spec.fromfile(data=attrs['data'], datatype=attrs['datatype'], databasis=attrs['databasis']) for attrs in _synthetic_attrs(size)}
+
+def _synthetic_catalog(size, directory):
+    specs_file = os.path.join(directory, 'specs{}.csv'.format(size))
+    rows = [dict(attrs, databasis=json.dumps(attrs['databasis'])) for attrs in _synthetic_attrs(size)]
+    pd.DataFrame(rows, columns=['datakey', 'data', 'datatype', 'databasis']).to_csv(specs_file, index=False)
+    return specs_file
+
+def _synthetic_strings(datatype, size, seed=0):
+    generator = np.random.default_rng(seed)
+    nums = generator.integers(1, 1000, size=size)
+    if datatype == 'num': return ['{}K $'.format(num) for num in nums]
+    if datatype == 'range': return ['{}K $|{}K $'.format(num, num + 10) if num % 3 else '>{}K $'.format(num) for num in nums]
+    if datatype == 'category': return [CATEGORIES[num % len(CATEGORIES)] for num in nums]
+    if datatype == 'histogram': return ['|'.join(['{}={}'.format(category, (num * position) % 97) for position, category in enumerate(CATEGORIES)]) for num in nums]
+    raise KeyError(datatype)
+
+def _uninterned(spec): return ABCMeta.__call__(type(spec), **spec.todict())
+
+def _synthetic_spec(datatype):
+    from specs.spec import Spec
+    attrs = [attrs for attrs in _synthetic_attrs(len(DATATYPES)) if attrs['datatype'] == datatype][0]
+    return Spec.fromfile(data=attrs['data'], datatype=datatype, databasis=dict(attrs['databasis'], precision=0, multiplier='K', unit='$') if datatype in ('num', 'range') else attrs['databasis'])
+
+
+@_benchmark('import')
+def _import(size, directory):
+    script = 'import sys, specs; sys.exit(len([name for name in {} if name in sys.modules]))'.format(repr(HEAVY))
+    environment = dict(os.environ, PYTHONPATH=os.pathsep.join([path for path in sys.path if path]))
+    def function():
+        if subprocess.run([sys.executable, '-c', script], env=environment).returncode: raise RuntimeError('import specs loaded one of {}'.format(', '.join(HEAVY)))
+    return function
+
+@_benchmark('fromfile.catalog')
+def _fromfile_catalog(size, directory):
+    from specs import specs_fromfile
+    specs_file = _synthetic_catalog(size, directory)
+    return lambda: specs_fromfile(specs_file, PARSERS, cache=False)
+
+@_benchmark('fromfile.binary')
+def _fromfile_binary(size, directory):
+    from specs import specs_fromfile
+    specs_file = _synthetic_catalog(size, directory)
+    specs_fromfile(specs_file, PARSERS, cache=True)
+    return lambda: specs_fromfile(specs_file, PARSERS, cache=True)
+
+def _codecs(datatype):
+    @_benchmark('asval.{}'.format(datatype))
+    def _asval(size, directory):
+        spec, strings = _synthetic_spec(datatype), _synthetic_strings(datatype, size)
+        return lambda: [spec.asval(string) for string in strings]
+    @_benchmark('asstr.{}'.format(datatype))
+    def _asstr(size, directory):
+        spec, strings = _synthetic_spec(datatype), _synthetic_strings(datatype, size)
+        values = [spec.asval(string) for string in strings]
+        return lambda: [spec.asstr(value) for value in values]
+
+for datatype in DATATYPES: _codecs(datatype)
+
+@_benchmark('derivation')
+def _derivation(size, directory):
+    from specs.spec import Spec
+    specs = [spec for spec in _synthetic_specs(size).values() if spec.datatype == 'num']
+    def function():
+        Spec.derivations().clear()
+        return [spec.multiply(2).moving(how='average', period=3).scale(how='standardize') + spec.multiply(2).moving(how='average', period=3).scale(how='standardize') for spec in specs]
+    return function
+
+@_benchmark('jsonstr')
+def _jsonstr(size, directory):
+    specs = list(_synthetic_specs(size).values())
+    return lambda: [spec.jsonstr() for spec in specs]
+
+@_benchmark('json.file')
+def _jsonfile(size, directory):
+    from specs.spec import Spec
+    specs = list(_synthetic_specs(size).values())
+    files = [os.path.join(directory, 'spec{}.json'.format(index)) for index in range(len(specs))]
+    def function():
+        for spec, file in zip(specs, files): spec.tojson(file)
+        return [Spec.fromjson(file) for file in files]
+    return function
+
+@_benchmark('hasheq')
+def _hasheq(size, directory):
+    specs = list(_synthetic_specs(size).values())
+    others = [_uninterned(spec) for spec in specs]
+    def function():
+        table = {spec:index for index, spec in enumerate(specs)}
+        return [table[other] for other in others], [spec == other for spec, other in zip(specs, others)], len(set(specs) | set(others))
+    return function
+
+
+class SpecBenchmark(object):
+    def __init__(self, *args, sizes=SIZES, repeat=REPEAT, **kwargs):
+        assert all([isinstance(size, int) and size > 0 for size in sizes]) and int(repeat) > 0
+        self.__sizes, self.__repeat = tuple(sizes), int(repeat)
+
+    @property
+    def sizes(self): return self.__sizes
+    @property
+    def repeat(self): return self.__repeat
+    def __repr__(self): return '{}(sizes={}, repeat={})'.format(self.__class__.__name__, self.sizes, self.repeat)
+
+    def __call__(self, *names):
+        names = names if names else tuple(BENCHMARKS.keys())
+        results = {}
+        with tempfile.TemporaryDirectory() as directory:
+            for name in names:
+                for size in self.sizes: results['{}[{}]'.format(name, size)] = self.measure(BENCHMARKS[name](size, directory), size)
+        return dict(meta=self.meta(), results=results)
+
+    def measure(self, function, size):
+        timings = []
+        for _ in range(self.repeat):
+            start = time.perf_counter()
+            function()
+            timings.append(time.perf_counter() - start)
+        return dict(size=size, best=min(timings), median=float(np.median(timings)), rate=size / min(timings) if min(timings) > 0 else float('inf'))
+
+    def meta(self): return dict(python=platform.python_version(), numpy=np.__version__, pandas=pd.__version__, platform=platform.platform(), sizes=list(self.sizes), repeat=self.repeat)
+
+    @staticmethod
+    def compare(results, baseline, *args, threshold=THRESHOLD, thresholds={}, **kwargs):
+        regressions = {}
+        for key, result in results['results'].items():
+            if key not in baseline['results']: continue
+            ratio = result['best'] / baseline['results'][key]['best'] if baseline['results'][key]['best'] > 0 else 1
+            limit = thresholds.get(key.split('[')[0], threshold)
+            if ratio > 1 + limit: regressions[key] = dict(ratio=ratio, threshold=limit, best=result['best'], baseline=baseline['results'][key]['best'])
+        return regressions
+
+    @staticmethod
+    def save(results, file):
+        with open(file, 'w') as outfile: json.dump(results, outfile, sort_keys=True, indent=3, separators=(',', ' : '))
+    @staticmethod
+    def load(file):
+        if not os.path.isfile(file): raise FileNotFoundError(file)
+        with open(file, 'r') as infile: return json.load(infile)
+
+
+def main(*args):
+    parser = argparse.ArgumentParser(description='Benchmark the specs hot paths against an optional baseline')
+    parser.add_argument('names', nargs='*', default=[])
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(SIZES))
+    parser.add_argument('--repeat', type=int, default=REPEAT)
+    parser.add_argument('--output', default=None)
+    parser.add_argument('--baseline', default=None)
+    parser.add_argument('--threshold', type=float, default=THRESHOLD)
+    parser.add_argument('--thresholds', type=json.loads, default={})
+    inputs = parser.parse_args(args if args else None)
+    if any([name not in BENCHMARKS.keys() for name in inputs.names]): parser.error('choose from {}'.format(', '.join(BENCHMARKS.keys())))
+    results = SpecBenchmark(sizes=inputs.sizes, repeat=inputs.repeat)(*inputs.names)
+    if inputs.output: SpecBenchmark.save(results, inputs.output)
+    else: print(json.dumps(results, sort_keys=True, indent=3, separators=(',', ' : ')))
+    if not inputs.baseline: return 0
+    regressions = SpecBenchmark.compare(results, SpecBenchmark.load(inputs.baseline), threshold=inputs.threshold, thresholds=inputs.thresholds)
+    for key, regression in regressions.items(): print('REGRESSION {}: {ratio:.2f}x (threshold {threshold:.0%})'.format(key, **regression), file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__': sys.exit(main())
+
+
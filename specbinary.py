@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Oct 17 2026
+@name:   SpecBinary Functions
+@author: Jack Kirby Cook
+
+"""
+
+import os
+import os.path
+import struct
+import hashlib
+from numbers import Number
+from functools import partial
+from types import CodeType, FunctionType, BuiltinFunctionType, ModuleType
+import numpy as np
+
+from utilities.quantities import Multiplier, Unit, Heading
+
+from specs.spec import Spec
+
+__version__ = "1.0.0"
+__author__ = "Jack Kirby Cook"
+__all__ = ['specs_tobinary', 'specs_frombinary', 'binary_file']
+__copyright__ = "Copyright 2018, Jack Kirby Cook"
+__license__ = ""
+
+
+MAGIC = b'SPECBIN2'
+BINARYEXT = '.specbin'
+HEADER = struct.Struct('<8s32sqq32sqqq')
+STRINGS = ('datakey', 'data', 'datatype', 'numdirection', 'heading', 'multiplier', 'unit')
+INTEGERS = ('precision',)
+FIELDS = STRINGS + INTEGERS + ('basisstart', 'basisstop')
+QUANTITIES = {'heading':Heading, 'multiplier':Multiplier, 'unit':Unit}
+NULL = -1
+
+_binarydtype = np.dtype('<i8')
+
+
+def binary_file(specs_file): return specs_file + BINARYEXT
+
+def _fingerprint(specs_file):
+    stat = os.stat(specs_file)
+    return stat.st_size, stat.st_mtime_ns
+
+def _digest(specs_file):
+    with open(specs_file, 'rb') as infile:
+        return hashlib.sha256(infile.read()).digest()
+
+def _cellcontents(cell):
+    try: return ('cell', cell.cell_contents)
+    except ValueError: return ('cell',)
+
+def _parserstate(value, parents=()):
+    if isinstance(value, (str, bytes, Number, type(None))): return (type(value).__qualname__, value)
+    if id(value) in parents: return ('cycle',)
+    parents = (*parents, id(value))
+    state = lambda item: _parserstate(item, parents)
+    if isinstance(value, (tuple, list)): return (type(value).__qualname__, *[state(item) for item in value])
+    if isinstance(value, (set, frozenset)): return (type(value).__qualname__, *sorted([state(item) for item in value], key=repr))
+    if isinstance(value, dict): return (type(value).__qualname__, *sorted([(state(key), state(item)) for key, item in value.items()], key=repr))
+    if isinstance(value, CodeType): return ('code', value.co_code, value.co_names, state(value.co_consts))
+    if isinstance(value, FunctionType):
+        cells = [_cellcontents(cell) for cell in (value.__closure__ or ())]
+        return ('function', value.__module__, value.__qualname__, state(value.__code__), state(value.__defaults__), state(value.__kwdefaults__), state(cells))
+    if isinstance(value, ModuleType): return ('module', value.__name__)
+    if isinstance(value, partial): return ('partial', state(value.func), state(value.args), state(value.keywords))
+    if isinstance(value, (type, BuiltinFunctionType)) and isinstance(getattr(value, '__self__', None), (ModuleType, type(None))): return ('builtin', value.__module__, value.__qualname__)
+    raise TypeError(value)
+
+def _parsers(specs_parsers):
+    try: states = sorted([(str(name), _parserstate(parser)) for name, parser in specs_parsers.items()], key=repr)
+    except (TypeError, ValueError): return None
+    return hashlib.sha256(repr(states).encode('utf-8')).digest()
+
+
+def specs_tobinary(specs, specs_file, specs_parsers={}):
+    strings, records, categories, indexes = {}, [], [], []
+    stringid = lambda string: strings.setdefault(str(string), len(strings))
+    for datakey, spec in specs.items():
+        attrs = dict(datakey=datakey, **spec.todict())
+        record = [stringid(attrs[field]) if field in attrs else NULL for field in STRINGS]
+        record += [int(attrs[field]) if field in attrs else NULL for field in INTEGERS]
+        record += [len(categories), len(categories) + len(attrs['categories'])] if 'categories' in attrs else [NULL, NULL]
+        categories += [stringid(category) for category in attrs.get('categories', ())]
+        indexes += [int(index) for index in attrs.get('indexes', ())]
+        records.append(record)
+    blobs = [string.encode('utf-8') for string in strings.keys()]
+    offsets = np.cumsum([0] + [len(blob) for blob in blobs], dtype=_binarydtype)
+    records = np.array(records, dtype=_binarydtype).reshape(-1, len(FIELDS))
+    parsers, (size, mtime) = _parsers(specs_parsers), _fingerprint(specs_file)
+    if parsers is None: return False
+    header = HEADER.pack(MAGIC, parsers, size, mtime, _digest(specs_file), len(blobs), len(records), len(categories))
+    temporary = '{}.{}.tmp'.format(binary_file(specs_file), os.getpid())
+    try:
+        with open(temporary, 'wb') as outfile:
+            outfile.write(header)
+            for array in (offsets, records, np.array(categories, dtype=_binarydtype), np.array(indexes, dtype=_binarydtype)): outfile.write(array.tobytes())
+            outfile.write(b''.join(blobs))
+        os.replace(temporary, binary_file(specs_file))
+    except OSError:
+        if os.path.isfile(temporary): os.remove(temporary)
+        return False
+    return True
+
+
+def specs_frombinary(specs_file, specs_parsers={}):
+    if not os.path.isfile(binary_file(specs_file)) or os.path.getsize(binary_file(specs_file)) < HEADER.size: return None
+    buffer = np.memmap(binary_file(specs_file), dtype=np.uint8, mode='r')
+    magic, parsers, size, mtime, digest, nstrings, nrecords, nbasis = HEADER.unpack(buffer[:HEADER.size].tobytes())
+    if magic != MAGIC or parsers != _parsers(specs_parsers) or (size, mtime) != _fingerprint(specs_file) or digest != _digest(specs_file): return None
+    if min(nstrings, nrecords, nbasis) < 0: return None
+    sections = HEADER.size + _binarydtype.itemsize * (nstrings + 1 + nrecords * len(FIELDS) + nbasis * 2)
+    if sections > len(buffer): return None
+    try: return _specs(buffer, nstrings, nrecords, nbasis)
+    except (ValueError, IndexError, KeyError, TypeError, AssertionError, UnicodeDecodeError): return None
+
+def _specs(buffer, nstrings, nrecords, nbasis):
+    position = HEADER.size
+    def read(count):
+        nonlocal position
+        array = np.frombuffer(buffer, dtype=_binarydtype, count=count, offset=position)
+        position += array.nbytes
+        return array
+    offsets, records, categories, indexes = read(nstrings + 1), read(nrecords * len(FIELDS)).reshape(nrecords, len(FIELDS)), read(nbasis), read(nbasis)
+    blob = buffer[position:].tobytes()
+    if offsets[0] != 0 or offsets[-1] != len(blob) or np.any(np.diff(offsets) < 0): raise ValueError(offsets)
+    if records.size and records.min() < NULL: raise ValueError(records.min())
+    strings = [blob[start:stop].decode('utf-8') for start, stop in zip(offsets[:-1].tolist(), offsets[1:].tolist())]
+    quantities = {field:{} for field in QUANTITIES.keys()}
+    def quantity(field, stringid):
+        if stringid not in quantities[field]: quantities[field][stringid] = QUANTITIES[field].fromstr(strings[stringid])
+        return quantities[field][stringid]
+    specs = {}
+    for record in records.tolist():
+        record = dict(zip(FIELDS, record))
+        attrs = {field:quantity(field, record[field]) if field in QUANTITIES else strings[record[field]] for field in STRINGS if record[field] != NULL}
+        attrs.update({field:record[field] for field in INTEGERS if record[field] != NULL})
+        if record['basisstart'] != NULL:
+            basis = slice(record['basisstart'], record['basisstop'])
+            attrs.update(dict(categories=[strings[stringid] for stringid in categories[basis].tolist()], indexes=indexes[basis].tolist()))
+        datakey, datatype = attrs.pop('datakey'), attrs.pop('datatype')
+        specs[datakey] = Spec.registry()[datatype](**attrs)
+    return specs
+
+
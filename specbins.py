@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Oct 17 2026
+@name:   SpecBins Objects
+@author: Jack Kirby Cook
+
+"""
+
+import numpy as np
+import pandas as pd
+
+from specs.numspecs import RangeSpec
+from specs.specarrays import RangeArray
+
+__version__ = "1.0.0"
+__author__ = "Jack Kirby Cook"
+__all__ = ['SpecBins']
+__copyright__ = "Copyright 2018, Jack Kirby Cook"
+__license__ = ""
+
+
+CLOSED = ('left', 'right')
+
+_asfloats = lambda values: np.asarray(values.values if isinstance(values, pd.Series) else values, dtype=np.float64)
+
+
+def _asbounds(values):
+    if isinstance(values, pd.Series): values = values.array
+    if isinstance(values, RangeArray): return values.lowers, values.uppers
+    lowers, uppers = values
+    return _asfloats(lowers), _asfloats(uppers)
+
+
+def _sparsetable(widths):
+    table = [np.arange(len(widths))]
+    while 2 ** len(table) <= len(widths):
+        span, previous = 2 ** (len(table) - 1), table[-1]
+        left, right = previous[:-span], previous[span:]
+        table.append(np.where(widths[right] > widths[left], right, left))
+    return table
+
+def _argmaxquery(table, widths, starts, stops):
+    levels = np.floor(np.log2(np.maximum(stops - starts + 1, 1))).astype(np.int64)
+    results = np.full(starts.shape, -1, dtype=np.int64)
+    for level in np.unique(levels[stops >= starts]):
+        mask = (levels == level) & (stops >= starts)
+        left, right = table[level][starts[mask]], table[level][stops[mask] - 2 ** level + 1]
+        results[mask] = np.where(widths[right] > widths[left], right, left)
+    return results
+
+
+class SpecBins(object):
+    def __init__(self, spec, bins, *args, closed='left', **kwargs):
+        assert isinstance(spec, RangeSpec) and closed in CLOSED
+        if isinstance(bins, RangeArray): lowers, uppers = bins.lowers, bins.uppers
+        elif all([isinstance(item, str) for item in bins]): lowers, uppers, directions = spec.asvals(list(bins))
+        else: lowers, uppers = _asbounds(RangeArray._from_sequence(list(bins)))
+        if not len(lowers) or np.isnan(lowers).any() or np.isnan(uppers).any(): raise ValueError(bins)
+        order = np.lexsort((uppers, lowers))
+        self.__spec, self.__closed = spec, closed
+        self.__lowers, self.__uppers = np.asarray(lowers)[order], np.asarray(uppers)[order]
+        if (self.__lowers[1:] < self.__uppers[:-1]).any(): raise ValueError('overlapping bins: {}'.format(list(bins)))
+        self.__widths = self.__uppers - self.__lowers
+        self.__table = _sparsetable(self.__widths)
+        self.__labels = pd.Index(spec.asstrs(self.__lowers, self.__uppers)[0])
+
+    @property
+    def spec(self): return self.__spec
+    @property
+    def closed(self): return self.__closed
+    @property
+    def lowers(self): return self.__lowers
+    @property
+    def uppers(self): return self.__uppers
+    @property
+    def labels(self): return self.__labels
+    def __len__(self): return len(self.__lowers)
+    def __repr__(self): return '{}({}, closed={})'.format(self.__class__.__name__, list(self.labels), self.closed)
+
+    def __call__(self, values, *args, how='bins', **kwargs):
+        codes = getattr(self, how)(values)
+        return codes, self.categorical(codes)
+
+    def categorical(self, codes): return pd.Categorical.from_codes(codes, categories=self.labels)
+    def tostrs(self, codes): return np.asarray(self.categorical(codes), dtype=object)
+
+    def bins(self, values):
+        values = _asfloats(values)
+        if self.closed == 'left':
+            codes = np.searchsorted(self.__lowers, values, side='right') - 1
+            found = (codes >= 0) & (values < self.__uppers[codes])
+        else:
+            codes = np.searchsorted(self.__uppers, values, side='left')
+            found = (codes < len(self)) & (values > self.__lowers[np.minimum(codes, len(self) - 1)])
+        codes = np.minimum(np.maximum(codes, 0), len(self) - 1)
+        found = found | ((values == self.__lowers[codes]) & (values == self.__uppers[codes]))
+        return np.where(found & ~np.isnan(values), codes, -1)
+
+    def contains(self, values):
+        lowers, uppers = _asbounds(values)
+        codes = self.bins(lowers) if self.closed == 'left' else self.bins(uppers)
+        inside = (self.__lowers[codes] <= lowers) & (uppers <= self.__uppers[codes])
+        return np.where((codes >= 0) & inside, codes, -1)
+
+    def overlaps(self, values):
+        lowers, uppers = _asbounds(values)
+        points, side = lowers == uppers, 'right' if self.closed == 'left' else 'left'
+        starts = np.where(points, np.searchsorted(self.__uppers, lowers, side=side), np.searchsorted(self.__uppers, lowers, side='right'))
+        stops = np.where(points, np.searchsorted(self.__lowers, uppers, side=side), np.searchsorted(self.__lowers, uppers, side='left')) - 1
+        valid = (stops >= starts) & ~np.isnan(lowers) & ~np.isnan(uppers)
+        starts, stops = np.minimum(starts, len(self) - 1), np.maximum(stops, 0)
+        overlap = lambda codes: np.minimum(uppers, self.__uppers[codes]) - np.maximum(lowers, self.__lowers[codes])
+        with np.errstate(invalid='ignore'):
+            middles = _argmaxquery(self.__table, self.__widths, starts + 1, stops - 1)
+            candidates = np.stack([starts, np.where(middles >= 0, middles, starts), stops])
+            overlaps = np.stack([overlap(codes) for codes in candidates])
+        overlaps = np.where(np.isnan(overlaps), np.inf, overlaps)
+        codes = np.take_along_axis(candidates, np.argmax(overlaps, axis=0)[np.newaxis, :], axis=0)[0]
+        return np.where(valid, codes, -1)
+
+
@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Oct 17 2026
+@name:   SpecCache Objects
+@author: Jack Kirby Cook
+
+"""
+
+from threading import RLock
+from collections import OrderedDict
+
+__version__ = "1.0.0"
+__author__ = "Jack Kirby Cook"
+__all__ = ['LRUCache', 'DerivationCache']
+__copyright__ = "Copyright 2018, Jack Kirby Cook"
+__license__ = ""
+
+
+MISSING = object()
+
+
+class LRUCache(object):
+    def __init__(self, *args, size=None, **kwargs):
+        assert size is None or (isinstance(size, int) and size >= 0)
+        self.__size = size
+        self.__cache = OrderedDict()
+        self.__lock = RLock()
+        self.__hits, self.__misses = 0, 0
+
+    @property
+    def size(self): return self.__size
+    @property
+    def hits(self): return self.__hits
+    @property
+    def misses(self): return self.__misses
+
+    def __repr__(self): return '{}(size={})'.format(self.__class__.__name__, self.size)
+    def __len__(self): return len(self.__cache)
+    def __contains__(self, key): return key in self.__cache
+    def __bool__(self): return self.size is None or self.size > 0
+
+    def get(self, key, default=None):
+        with self.__lock:
+            try: value = self.__cache[key]
+            except KeyError:
+                self.__misses += 1
+                return default
+            self.__cache.move_to_end(key)
+            self.__hits += 1
+            return value
+
+    def put(self, key, value):
+        if not self: return value
+        with self.__lock:
+            self.__cache[key] = value
+            self.__cache.move_to_end(key)
+            while self.size is not None and len(self.__cache) > self.size: self.__cache.popitem(last=False)
+        return value
+
+    def resize(self, size):
+        assert size is None or (isinstance(size, int) and size >= 0)
+        with self.__lock:
+            self.__size = size
+            while self.size is not None and len(self.__cache) > self.size: self.__cache.popitem(last=False)
+
+    def clear(self):
+        with self.__lock:
+            self.__cache.clear()
+            self.__hits, self.__misses = 0, 0
+
+    def stats(self): return dict(hits=self.hits, misses=self.misses, size=self.size, currsize=len(self))
+
+
+class DerivationCache(object):
+    def __init__(self, *args, size=None, **kwargs):
+        self.__cache = LRUCache(size=size)
+        self.__methods = {}
+        self.__lock = RLock()
+
+    @property
+    def size(self): return self.__cache.size
+    def __repr__(self): return '{}(size={})'.format(self.__class__.__name__, self.size)
+    def __len__(self): return len(self.__cache)
+
+    def derive(self, key, method, function):
+        value = self.__cache.get(key, MISSING)
+        with self.__lock:
+            counts = self.__methods.setdefault(method, dict(hits=0, misses=0))
+            counts['hits' if value is not MISSING else 'misses'] += 1
+        if value is not MISSING: return value
+        return self.__cache.put(key, function())
+
+    def resize(self, size): self.__cache.resize(size)
+    def clear(self):
+        with self.__lock:
+            self.__cache.clear()
+            self.__methods.clear()
+
+    def stats(self): return dict(**self.__cache.stats(), methods={method:dict(counts) for method, counts in self.__methods.items()})
+
+
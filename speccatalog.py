@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Oct 17 2026
+@name:   SpecCatalog Objects
+@author: Jack Kirby Cook
+
+"""
+
+import os.path
+import glob
+import time
+from concurrent.futures import ThreadPoolExecutor
+import pandas as pd
+from collections.abc import Mapping
+
+import utilities.dataframes as dfs
+
+from specs.spec import Spec
+from specs.specbinary import specs_frombinary, specs_tobinary
+
+__version__ = "1.0.0"
+__author__ = "Jack Kirby Cook"
+__all__ = ['SpecCatalog', 'SpecConflictError', 'specs_fromfile', 'specs_fromfiles']
+__copyright__ = "Copyright 2018, Jack Kirby Cook"
+__license__ = ""
+
+
+class SpecConflictError(Exception):
+    def __init__(self, conflicts): super().__init__(', '.join(['{}({})'.format(datakey, ', '.join(files)) for datakey, files in conflicts.items()]))
+
+
+_aslist = lambda items: [items] if not isinstance(items, (list, tuple)) else list(items)
+_defaultparser = lambda item: str(item) if pd.notnull(item) else item
+_allnull = lambda items: all([pd.isnull(item) for item in items])
+
+
+class SpecCatalog(Mapping):
+    def __init__(self, specs_file, specs_parsers={}):
+        if not os.path.isfile(specs_file): raise FileNotFoundError(specs_file)
+        dataframe = dfs.dataframe_fromfile(specs_file)
+        dataframe = dfs.dataframe_parser(dataframe, parsers=specs_parsers, defaultparser=_defaultparser)
+        dataframe.set_index('datakey', drop=True, inplace=True)
+        dataframe = dataframe[dataframe.notnull().any(axis=1).values]
+        self.__file = specs_file
+        self.__columns = tuple(dataframe.columns)
+        self.__rows = dataframe.values
+        self.__positions = {key:position for position, key in enumerate(dataframe.index)}
+        self.__specs = {}
+
+    @property
+    def file(self): return self.__file
+    def __repr__(self): return '{}({}, loaded={}/{})'.format(self.__class__.__name__, repr(self.file), len(self.__specs), len(self))
+
+    def __len__(self): return len(self.__positions)
+    def __iter__(self): return iter(self.__positions)
+    def __contains__(self, key): return key in self.__positions
+    def __getitem__(self, key):
+        try: return self.__specs[key]
+        except KeyError: pass
+        row = self.__rows[self.__positions[key]]
+        values = {item:value for item, value in zip(self.__columns, row) if not _allnull(_aslist(value))}
+        return self.__specs.setdefault(key, Spec.fromfile(**values))
+
+    def loaded(self): return tuple(self.__specs.keys())
+
+
+def specs_fromfile(specs_file, specs_parsers, cache=True):
+    specs = specs_frombinary(specs_file, specs_parsers) if cache else None
+    if specs is not None: return specs
+    catalog = SpecCatalog(specs_file, specs_parsers)
+    specs = {key:catalog[key] for key in catalog.keys()}
+    if cache: specs_tobinary(specs, specs_file, specs_parsers)
+    return specs
+
+def _timedfromfile(specs_file, specs_parsers, cache):
+    start = time.perf_counter()
+    specs = specs_fromfile(specs_file, specs_parsers, cache=cache)
+    return specs, time.perf_counter() - start
+
+def _conflicting(spec, other): return spec is not other and spec.key != other.key
+
+def specs_fromfiles(specs_files, specs_parsers, *args, cache=True, workers=None, pattern='*.csv', conflicts='raise', **kwargs):
+    assert conflicts in ('raise', 'first', 'last')
+    if isinstance(specs_files, str) and os.path.isdir(specs_files): specs_files = sorted(glob.glob(os.path.join(specs_files, pattern)))
+    specs_files = _aslist(specs_files)
+    for specs_file in specs_files: 
+        if not os.path.isfile(specs_file): raise FileNotFoundError(specs_file)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(lambda specs_file: _timedfromfile(specs_file, specs_parsers, cache), specs_files))
+    merged, origins, collisions = {}, {}, {}
+    for specs_file, (specs, seconds) in zip(specs_files, results):
+        for datakey, spec in specs.items():
+            if datakey in merged and _conflicting(merged[datakey], spec): 
+                collisions.setdefault(datakey, [origins[datakey]]).append(specs_file)
+                if conflicts != 'last': continue
+            elif datakey in merged: continue
+            merged[datakey], origins[datakey] = spec, specs_file
+    if collisions and conflicts == 'raise': raise SpecConflictError(collisions)
+    timings = {specs_file:seconds for specs_file, (specs, seconds) in zip(specs_files, results)}
+    return merged, timings
+
+
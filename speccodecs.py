@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Oct 17 2026
+@name:   SpecCodec Objects
+@author: Jack Kirby Cook
+
+"""
+
+import math
+from numbers import Number
+
+from specs.speccaches import LRUCache, MISSING
+
+__version__ = "1.0.0"
+__author__ = "Jack Kirby Cook"
+__all__ = ['SpecCodec']
+__copyright__ = "Copyright 2018, Jack Kirby Cook"
+__license__ = ""
+
+
+def _hashable(value):
+    try: hash(value)
+    except TypeError: return False
+    return True
+
+def _valuekey(value):
+    if isinstance(value, tuple): return (tuple, *[_valuekey(item) for item in value])
+    if isinstance(value, float): return (type(value), value, math.copysign(1.0, value))
+    if isinstance(value, Number): return (type(value), value)
+    return value
+
+
+class SpecCodec(object):
+    def __init__(self, decoder, encoder, *args, size=0, **kwargs):
+        self.__decoder, self.__encoder = decoder, encoder
+        self.__values = LRUCache(size=size)
+        self.__strings = LRUCache(size=size)
+
+    @property
+    def size(self): return self.__values.size
+    def __repr__(self): return '{}(size={})'.format(self.__class__.__name__, self.size)
+
+    def asval(self, string):
+        if not self.__values or not _hashable(string): return self.__decoder(string)
+        value = self.__values.get(string, MISSING)
+        if value is not MISSING: return value
+        value = self.__decoder(string)
+        return self.__values.put(string, value) if _hashable(value) else value
+
+    def asstr(self, value):
+        if not self.__strings or not _hashable(value): return self.__encoder(value)
+        key = _valuekey(value)
+        string = self.__strings.get(key, MISSING)
+        if string is not MISSING: return string
+        return self.__strings.put(key, self.__encoder(value))
+
+    def clear(self):
+        self.__values.clear()
+        self.__strings.clear()
+
+    def stats(self): return dict(asval=self.__values.stats(), asstr=self.__strings.stats())
+
+
@@ -6,17 +6,19 @@ Created on Fri Apr 12 2018
 
 """
 
-from parse import parse
+from abc import ABC, abstractmethod
+from string import Formatter
+
+from specs.speccodecs import _hashable, _valuekey
 
 __version__ = "1.0.0"
 __author__ = "Jack Kirby Cook"
-__all__ = ['data_operation', 'data_transformation']
+__all__ = ['data_operation', 'data_transformation', 'data_tojson', 'data_fromjson', 'SpecData', 'DataName', 'DataOperation', 'DataTransformation']
 __copyright__ = "Copyright 2018, Jack Kirby Cook"
 __license__ = ""
 
 
 FORMATTING = '/*+-_ |'
-SIMPLIFY_FORMATTING = '{}/{}*{}'
 
 OPERATIONS = {
     'multiply':'{data}*{other}', 
@@ -51,40 +53,137 @@ TRANSFORMATIONS = {
         'median':'{axis}|wtmid|{data}'}}
 
 
-def data_operation(data, other, *args, method, simplify=False, **kwargs):
-    if method not in OPERATIONS.keys(): 
-        assert data == other
-        return data
-     
-    if any([opchar in data for opchar in FORMATTING]): data = '({})'.format(data)  
-    if any([opchar in data for opchar in FORMATTING]): other = '({})'.format(other)      
-    modifydata = OPERATIONS[method].format(data=data, other=other) if method in OPERATIONS else data
+_fields = lambda template: tuple([field for text, field, spec, conversion in Formatter().parse(template) if field])
+_wrap = lambda data, formatted=None: '({})'.format(str(data)) if (data.formatted if formatted is None else formatted) else str(data)
+_asdata = lambda data: data if isinstance(data, SpecData) else DataName(data)
 
-    if simplify:
-        unformated = parse(SIMPLIFY_FORMATTING, modifydata.replace('(', '').replace(')', ''))    
-        if unformated is not None: 
-            if len(set(unformated.fixed)) == 1: modifydata = unformated.fixed[0]       
-    
-    return modifydata
 
+class SpecData(ABC):
+    __slots__ = ('__key', '__hash', '__string')
 
-def data_transformation(data, *args, method, how, axis=None, **kwargs):
-    if method not in TRANSFORMATIONS.keys(): return data
-    if how not in TRANSFORMATIONS[method].keys(): return data
-    if any([opchar in data for opchar in FORMATTING]): data = '({})'.format(data)
-    modifydata = TRANSFORMATIONS[method][how].format(data=data, axis=axis if axis else '', **kwargs)
-    if modifydata[0] in FORMATTING: modifydata = modifydata[1:]
-    return modifydata
+    def __init__(self, *key):
+        self.__key = (self.__class__.__name__, *key)
+        self.__hash = hash(self.__key)
+        self.__string = None
+
+    @property
+    def key(self): return self.__key
+    @property
+    def formatted(self): return True
+
+    def __hash__(self): return self.__hash
+    def __eq__(self, other): return isinstance(other, SpecData) and hash(self) == hash(other) and self.key == other.key
+    def __ne__(self, other): return not self.__eq__(other)
+    def __repr__(self): return '{}({})'.format(self.__class__.__name__, str(self))
+    def __str__(self):
+        if self.__string is None: self.__string = self.render()
+        return self.__string
+
+    @abstractmethod
+    def render(self): pass
+
+
+class DataName(SpecData):
+    __slots__ = ('__name', '__formatted')
+
+    def __init__(self, name):
+        self.__name = str(name)
+        self.__formatted = None
+        super().__init__(self.__name)
+
+    @property
+    def name(self): return self.__name
+    @property
+    def formatted(self):
+        if self.__formatted is None: self.__formatted = any([opchar in self.__name for opchar in FORMATTING])
+        return self.__formatted
 
+    def __hash__(self): return hash(self.__name)
+    def __eq__(self, other): return self.__name == other if isinstance(other, str) else super().__eq__(other)
+    def render(self): return self.__name
 
 
+class DataOperation(SpecData):
+    __slots__ = ('__method', '__data', '__other')
 
+    def __init__(self, method, data, other):
+        assert method in OPERATIONS.keys()
+        self.__method, self.__data, self.__other = method, data, other
+        super().__init__(method, data, other)
 
+    @property
+    def method(self): return self.__method
+    @property
+    def data(self): return self.__data
+    @property
+    def other(self): return self.__other
 
+    def render(self): return OPERATIONS[self.__method].format(data=_wrap(self.__data), other=_wrap(self.__other, self.__data.formatted))
 
 
+class DataTransformation(SpecData):
+    __slots__ = ('__method', '__how', '__data', '__params')
 
+    def __init__(self, method, how, data, params):
+        assert method in TRANSFORMATIONS.keys() and how in TRANSFORMATIONS[method].keys()
+        self.__method, self.__how, self.__data, self.__params = method, how, data, tuple(params)
+        super().__init__(method, how, data, _valuekey(self.__params))
 
+    @property
+    def method(self): return self.__method
+    @property
+    def how(self): return self.__how
+    @property
+    def data(self): return self.__data
+    @property
+    def params(self): return dict(self.__params)
+
+    def render(self):
+        modifydata = TRANSFORMATIONS[self.__method][self.__how].format(data=_wrap(self.__data), **self.params)
+        if modifydata[0] in FORMATTING: modifydata = modifydata[1:]
+        return modifydata
+
+
+def _simplify(method, data, other):
+    if method == 'multiply' and isinstance(data, DataOperation) and data.method == 'divide' and data.other == other: return data.data
+    if method == 'multiply' and isinstance(other, DataOperation) and other.method == 'divide' and other.other == data: return other.data
+    if method == 'divide' and isinstance(data, DataOperation) and data.method == 'multiply' and data.other == other: return data.data
+    if method == 'divide' and isinstance(data, DataOperation) and data.method == 'multiply' and data.data == other: return data.other
+    return None
+
+
+def data_operation(data, other, *args, method, simplify=False, **kwargs):
+    if method not in OPERATIONS.keys(): 
+        assert data == other
+        return data
+    data, other = _asdata(data), _asdata(other)
+    simplified = _simplify(method, data, other) if simplify else None
+    return simplified if simplified is not None else DataOperation(method, data, other)
+
+
+def data_transformation(data, *args, method, how, axis=None, **kwargs):
+    if method not in TRANSFORMATIONS.keys(): return data
+    if how not in TRANSFORMATIONS[method].keys(): return data
+    template = TRANSFORMATIONS[method][how]
+    params = dict(axis=axis if axis else '', **kwargs)
+    params = [(field, params[field] if _hashable(params[field]) else str(params[field])) for field in _fields(template) if field != 'data']
+    return DataTransformation(method, how, _asdata(data), params)
+
+
+def data_tojson(data):
+    if isinstance(data, DataName): return data.name
+    if isinstance(data, DataOperation): return dict(operation=data.method, data=data_tojson(data.data), other=data_tojson(data.other))
+    if isinstance(data, DataTransformation): return dict(transformation=data.method, how=data.how, data=data_tojson(data.data), params=data.params)
+    raise TypeError(type(data).__name__)
+
+
+def data_fromjson(data):
+    if isinstance(data, SpecData): return data
+    if not isinstance(data, dict): return DataName(data)
+    if 'operation' in data.keys(): return DataOperation(data['operation'], data_fromjson(data['data']), data_fromjson(data['other']))
+    template, params = TRANSFORMATIONS[data['transformation']][data['how']], data['params']
+    params = [(field, tuple(params[field]) if isinstance(params[field], list) else params[field]) for field in _fields(template) if field != 'data']
+    return DataTransformation(data['transformation'], data['how'], data_fromjson(data['data']), params)
 
 
 
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Oct 17 2026
+@name:   SpecEngine Objects
+@author: Jack Kirby Cook
+
+"""
+
+import numpy as np
+import pandas as pd
+
+from specs.spec import Spec, SpecTransformationNotSupportedError
+from specs.specdata import DataName, DataOperation, DataTransformation
+from specs.specarrays import RangeArray
+from specs.speckernels import MOVING
+from specs.specscalers import SCALERS
+
+__version__ = "1.0.0"
+__author__ = "Jack Kirby Cook"
+__all__ = ['SpecEngine', 'specs_evaluate']
+__copyright__ = "Copyright 2018, Jack Kirby Cook"
+__license__ = ""
+
+
+OPERATIONS = {
+    'multiply':lambda data, other: np.multiply(data, other),
+    'divide':lambda data, other: np.divide(data, other)}
+TRANSFORMATIONS = {
+    'factor':{
+        'multiply':lambda data, *args, factor, **kwargs: np.multiply(data, float(factor)),
+        'divide':lambda data, *args, factor, **kwargs: np.divide(data, float(factor))},
+    'moving':MOVING,
+    'scale':{how:lambda data, *args, scaler=scaler, axis=None, **kwargs: scaler(axis=0).fit_transform(data) for how, scaler in SCALERS.items()}}
+
+_ascolumn = lambda result: RangeArray(*result) if isinstance(result, tuple) else result
+
+
+class SpecEngine(object):
+    def __init__(self, dataframe, *args, **kwargs):
+        assert isinstance(dataframe, pd.DataFrame)
+        self.__dataframe = dataframe
+        self.__results = {}
+
+    @property
+    def dataframe(self): return self.__dataframe
+    def __repr__(self): return '{}(columns={}, evaluated={})'.format(self.__class__.__name__, len(self.__dataframe.columns), len(self.__results))
+    def __len__(self): return len(self.__results)
+
+    def __call__(self, *specs):
+        specs = [spec for items in specs for spec in (items if isinstance(items, (list, tuple)) else [items])]
+        assert all([isinstance(spec, Spec) for spec in specs])
+        with np.errstate(divide='ignore', invalid='ignore'):
+            results = {str(spec.data):_ascolumn(self.evaluate(spec.data)) for spec in specs}
+        return pd.DataFrame(results, index=self.__dataframe.index)
+
+    def evaluate(self, data):
+        try: return self.__results[data]
+        except KeyError: pass
+        if isinstance(data, DataName): result = self.__dataframe[data.name].to_numpy(dtype=np.float64)
+        elif isinstance(data, DataOperation): result = OPERATIONS[data.method](self.evaluate(data.data), self.evaluate(data.other))
+        elif isinstance(data, DataTransformation): result = self.transform(data)
+        else: raise TypeError(type(data).__name__)
+        return self.__results.setdefault(data, result)
+
+    def transform(self, data):
+        try: kernel = TRANSFORMATIONS[data.method][data.how]
+        except KeyError: raise SpecTransformationNotSupportedError(data, data.method, data.how)
+        return kernel(self.evaluate(data.data), **data.params)
+
+    def clear(self): self.__results.clear()
+
+
+def specs_evaluate(specs, dataframe): return SpecEngine(dataframe)(*specs)
+
+
@@ -0,0 +1,191 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Oct 17 2026
+@name:   SpecKernel Functions
+@author: Jack Kirby Cook
+
+"""
+
+from specs.speclazy import LazyModule
+
+__version__ = "1.0.0"
+__author__ = "Jack Kirby Cook"
+__all__ = ['moving_average', 'moving_summation', 'moving_couple', 'moving_difference', 'MOVING', 'MovingWindow', 'weighted_average', 'weighted_stdev', 'weighted_median', 'WTREDUCTION', 'cumulate', 'uncumulate', 'CUMULATE']
+__copyright__ = "Copyright 2018, Jack Kirby Cook"
+__license__ = ""
+
+
+np = LazyModule('numpy', owner=__name__, alias='np')
+
+def _alongaxis(function):
+    def wrapper(values, *args, axis=-1, **kwargs):
+        values = np.moveaxis(np.asarray(values, dtype=np.float64), axis, -1)
+        results = function(values, *args, **kwargs)
+        if isinstance(results, tuple): return tuple([np.moveaxis(result, -1, axis) for result in results])
+        return np.moveaxis(results, -1, axis)
+    wrapper.__name__ = function.__name__
+    return wrapper
+
+
+def _windowsum(values, period):
+    assert isinstance(period, int) and period > 0
+    nulls = np.isnan(values)
+    padding = [(0, 0)] * (values.ndim - 1) + [(1, 0)]
+    sums = np.pad(np.cumsum(np.where(nulls, 0, values), axis=-1), padding)
+    counts = np.pad(np.cumsum(nulls, axis=-1), padding)
+    results = np.full(values.shape, np.nan)
+    if values.shape[-1] < period: return results
+    results[..., period-1:] = sums[..., period:] - sums[..., :-period]
+    results[..., period-1:][(counts[..., period:] - counts[..., :-period]) > 0] = np.nan
+    return results
+
+
+def _windowextreme(values, period, ufunc):
+    assert isinstance(period, int) and period > 0
+    length = values.shape[-1]
+    results = np.full(values.shape, np.nan)
+    if length < period: return results
+    blocks = -(-length // period)
+    padding = [(0, 0)] * (values.ndim - 1) + [(0, blocks * period - length)]
+    padded = np.pad(values, padding, constant_values=np.nan).reshape(*values.shape[:-1], blocks, period)
+    prefixes = ufunc.accumulate(padded, axis=-1).reshape(*values.shape[:-1], -1)
+    suffixes = np.flip(ufunc.accumulate(np.flip(padded, axis=-1), axis=-1), axis=-1).reshape(*values.shape[:-1], -1)
+    results[..., period-1:] = ufunc(suffixes[..., :length-period+1], prefixes[..., period-1:length])
+    return results
+
+
+@_alongaxis
+def moving_summation(values, *args, period, **kwargs): return _windowsum(values, int(period))
+
+@_alongaxis
+def moving_average(values, *args, period, **kwargs): return _windowsum(values, int(period)) / int(period)
+
+@_alongaxis
+def moving_couple(values, *args, period, **kwargs):
+    return _windowextreme(values, int(period), np.minimum), _windowextreme(values, int(period), np.maximum)
+
+@_alongaxis
+def moving_difference(values, *args, period, **kwargs):
+    period = int(period)
+    results = np.full(values.shape, np.nan)
+    results[..., period:] = values[..., period:] - values[..., :-period]
+    return results
+
+
+MOVING = {
+    'average':moving_average,
+    'summation':moving_summation,
+    'couple':moving_couple,
+    'difference':moving_difference}
+LOOKBACKS = {
+    'average':lambda period: period - 1,
+    'summation':lambda period: period - 1,
+    'couple':lambda period: period - 1,
+    'difference':lambda period: period}
+
+
+class MovingWindow(object):
+    def __init__(self, *args, how, period, axis=-1, **kwargs):
+        assert how in MOVING.keys()
+        self.__how, self.__period, self.__axis = how, int(period), axis
+        self.__history = None
+
+    @property
+    def how(self): return self.__how
+    @property
+    def period(self): return self.__period
+    def __repr__(self): return '{}(how={}, period={})'.format(self.__class__.__name__, self.how, self.period)
+
+    @classmethod
+    def fromdata(cls, data, *args, **kwargs):
+        assert data.method == 'moving'
+        return cls(*args, how=data.how, period=data.params['period'], **kwargs)
+
+    def __call__(self, chunk):
+        chunk = np.moveaxis(np.asarray(chunk, dtype=np.float64), self.__axis, -1)
+        history = self.__history if self.__history is not None else chunk[..., :0]
+        values = np.concatenate([history, chunk], axis=-1)
+        lookback = LOOKBACKS[self.how](self.period)
+        self.__history = values[..., max(values.shape[-1] - lookback, 0):].copy()
+        results = MOVING[self.how](values, period=self.period)
+        if isinstance(results, tuple): return tuple([np.moveaxis(result[..., history.shape[-1]:], -1, self.__axis) for result in results])
+        return np.moveaxis(results[..., history.shape[-1]:], -1, self.__axis)
+
+    def reset(self): self.__history = None
+
+
+def _sortbins(counts, lowers, uppers):
+    lowers, uppers = np.asarray(lowers, dtype=np.float64), np.asarray(uppers, dtype=np.float64)
+    assert counts.shape[-1] == len(lowers) == len(uppers)
+    order = np.lexsort((uppers, lowers))
+    return counts[..., order], lowers[order], uppers[order]
+
+def _binvalues(lowers, uppers, weight):
+    with np.errstate(invalid='ignore'):
+        values = lowers + weight * (uppers - lowers)
+    values = np.where(np.isneginf(lowers), uppers, values)
+    return np.where(np.isposinf(uppers), lowers, values)
+
+def _weightedmoments(counts, lowers, uppers, weight):
+    counts, lowers, uppers = _sortbins(counts, lowers, uppers)
+    nulls = np.isnan(counts).all(axis=-1)
+    counts = np.nan_to_num(counts)
+    values = _binvalues(lowers, uppers, weight)
+    totals = np.sum(counts, axis=-1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        means = np.where(nulls, np.nan, np.sum(counts * values, axis=-1) / totals)
+        variances = np.where(nulls, np.nan, np.sum(counts * (values - means[..., np.newaxis]) ** 2, axis=-1) / totals)
+    return means, variances
+
+
+@_alongaxis
+def weighted_average(counts, lowers, uppers, *args, weight=0.5, **kwargs): return _weightedmoments(counts, lowers, uppers, weight)[0]
+
+@_alongaxis
+def weighted_stdev(counts, lowers, uppers, *args, weight=0.5, **kwargs): return np.sqrt(_weightedmoments(counts, lowers, uppers, weight)[1])
+
+@_alongaxis
+def weighted_median(counts, lowers, uppers, *args, **kwargs):
+    counts, lowers, uppers = _sortbins(counts, lowers, uppers)
+    nulls = np.isnan(counts).all(axis=-1)
+    counts = np.nan_to_num(counts)
+    cumulatives = np.cumsum(counts, axis=-1)
+    halves = cumulatives[..., -1:] / 2
+    positions = np.minimum(np.sum(cumulatives < halves, axis=-1, keepdims=True), counts.shape[-1] - 1)
+    befores = np.take_along_axis(cumulatives, positions, axis=-1) - np.take_along_axis(counts, positions, axis=-1)
+    within = np.take_along_axis(counts, positions, axis=-1)
+    lower, upper = lowers[positions], uppers[positions]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        medians = lower + np.where(within > 0, (halves - befores) / within, 0) * (upper - lower)
+    medians = np.where(np.isneginf(lower), upper, np.where(np.isposinf(upper), lower, medians))[..., 0]
+    return np.where(nulls | (cumulatives[..., -1] <= 0), np.nan, medians)
+
+
+WTREDUCTION = {
+    'average':weighted_average,
+    'stdev':weighted_stdev,
+    'median':weighted_median}
+
+
+def _inplace(values, axis, direction):
+    assert direction == 'lower' or direction == 'upper'
+    if not isinstance(values, np.ndarray) or values.dtype.kind != 'f' or not values.flags.writeable: values = np.array(values, dtype=np.float64)
+    view = np.moveaxis(values, axis, -1)
+    return values, view if direction == 'lower' else view[..., ::-1]
+
+def cumulate(values, *args, direction, axis=-1, **kwargs):
+    values, view = _inplace(values, axis, direction)
+    np.cumsum(view, axis=-1, out=view)
+    return values
+
+def uncumulate(values, *args, direction, axis=-1, **kwargs):
+    values, view = _inplace(values, axis, direction)
+    for index in reversed(range(1, view.shape[-1])): np.subtract(view[..., index], view[..., index-1], out=view[..., index])
+    return values
+
+
+CUMULATE = {
+    'consolidate':cumulate,
+    'unconsolidate':uncumulate}
+
+
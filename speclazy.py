@@ -0,0 +1,29 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Oct 17 2026
+@name:   SpecLazy Objects
+@author: Jack Kirby Cook
+
+"""
+
+import sys
+import importlib
+
+__version__ = "1.0.0"
+__author__ = "Jack Kirby Cook"
+__all__ = ['LazyModule']
+__copyright__ = "Copyright 2018, Jack Kirby Cook"
+__license__ = ""
+
+
+class LazyModule(object):
+    def __init__(self, name, *args, owner, alias, **kwargs): self.__name, self.__owner, self.__alias = name, owner, alias
+    def __repr__(self): return '{}({}, loaded={})'.format(self.__class__.__name__, self.__name, self.__name in sys.modules)
+
+    def __getattr__(self, attr):
+        module = importlib.import_module(self.__name)
+        owner = sys.modules.get(self.__owner, None)
+        if owner is not None and getattr(owner, self.__alias, None) is self: setattr(owner, self.__alias, module)
+        return getattr(module, attr)
+
+
@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Oct 17 2026
+@name:   SpecPool Objects
+@author: Jack Kirby Cook
+
+"""
+
+import os
+import numpy as np
+import pandas as pd
+from collections.abc import Mapping
+from multiprocessing import shared_memory
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from specs.spec import Spec
+from specs.specstreams import DECODERS
+
+__version__ = "1.0.0"
+__author__ = "Jack Kirby Cook"
+__all__ = ['SpecPool', 'specs_decodetable', 'specs_encodetable']
+__copyright__ = "Copyright 2018, Jack Kirby Cook"
+__license__ = ""
+
+
+BLOCKSIZE = 262144
+THRESHOLD = 1048576
+SHAPES = {
+    'num':lambda spec, rows: [('values', np.float64, (rows,))],
+    'range':lambda spec, rows: [('lowers', np.float64, (rows,)), ('uppers', np.float64, (rows,))],
+    'category':lambda spec, rows: [('matrix', np.float64, (rows, len(spec.categories)))],
+    'histogram':lambda spec, rows: [('matrix', np.float64, (rows, len(spec.categories)))]}
+ENCODERS = {
+    'num':lambda spec, values: spec.asstrs(*values)[0],
+    'range':lambda spec, values: spec.asstrs(*values)[0],
+    'category':lambda spec, values: spec.asstrs(*values)[0],
+    'histogram':lambda spec, values: spec.asstrs(*values)[0]}
+
+
+def _attach(name):
+    try: return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError: return shared_memory.SharedMemory(name=name)
+
+def _blocks(rows, blocksize): return [(start, min(start + blocksize, rows)) for start in range(0, rows, blocksize)]
+
+
+def _decodeblock(spec, strings, outputs, start, stop):
+    results = DECODERS[spec.datatype](spec, strings)
+    for output, values in zip(outputs, results if spec.datatype == 'range' else [results]): output[start:stop] = values
+
+def _encodeblock(spec, inputs, start, stop): return ENCODERS[spec.datatype](spec, [values[start:stop] for values in inputs])
+
+def _shareddecode(spec, strings, layouts, start, stop):
+    memories = [_attach(name) for name, dtype, shape in layouts]
+    try: _decodeblock(spec, strings, [np.ndarray(shape, dtype=dtype, buffer=memory.buf) for memory, (name, dtype, shape) in zip(memories, layouts)], start, stop)
+    finally:
+        for memory in memories: memory.close()
+
+def _sharedencode(spec, layouts, start, stop):
+    memories = [_attach(name) for name, dtype, shape in layouts]
+    try: return _encodeblock(spec, [np.ndarray(shape, dtype=dtype, buffer=memory.buf) for memory, (name, dtype, shape) in zip(memories, layouts)], start, stop)
+    finally:
+        for memory in memories: memory.close()
+
+
+class SharedArrays(object):
+    def __init__(self, layouts):
+        self.__memories = [shared_memory.SharedMemory(create=True, size=max(int(np.prod(shape, dtype=np.int64)) * np.dtype(dtype).itemsize, 1)) for dtype, shape in layouts]
+        self.__arrays = [np.ndarray(shape, dtype=dtype, buffer=memory.buf) for memory, (dtype, shape) in zip(self.__memories, layouts)]
+        self.__layouts = [(memory.name, dtype, shape) for memory, (dtype, shape) in zip(self.__memories, layouts)]
+
+    @property
+    def arrays(self): return self.__arrays
+    @property
+    def layouts(self): return self.__layouts
+
+    def __enter__(self): return self
+    def __exit__(self, *args):
+        del self.__arrays
+        for memory in self.__memories:
+            memory.close()
+            memory.unlink()
+
+
+class SpecPool(object):
+    def __init__(self, *args, workers=None, blocksize=BLOCKSIZE, threshold=THRESHOLD, **kwargs):
+        self.__workers = int(workers) if workers is not None else os.cpu_count() or 1
+        self.__blocksize, self.__threshold = int(blocksize), int(threshold)
+
+    @property
+    def workers(self): return self.__workers
+    @property
+    def blocksize(self): return self.__blocksize
+    @property
+    def threshold(self): return self.__threshold
+    def __repr__(self): return '{}(workers={}, blocksize={}, threshold={})'.format(self.__class__.__name__, self.workers, self.blocksize, self.threshold)
+
+    def parallel(self, cells): return self.workers > 1 and cells >= self.threshold
+
+    def decode(self, dataframe, specs):
+        assert isinstance(dataframe, pd.DataFrame) and isinstance(specs, Mapping)
+        specs = {key:spec for key, spec in specs.items() if key in dataframe.columns}
+        assert all([isinstance(spec, Spec) for spec in specs.values()])
+        rows = len(dataframe)
+        layouts = {key:SHAPES[spec.datatype](spec, rows) for key, spec in specs.items()}
+        strings = {key:np.asarray(dataframe[key].values, dtype=object) for key in specs.keys()}
+        blocks = _blocks(rows, self.blocksize)
+        if not self.parallel(rows * len(specs)):
+            outputs = {key:[np.empty(shape, dtype=dtype) for name, dtype, shape in layout] for key, layout in layouts.items()}
+            with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                futures = [executor.submit(_decodeblock, spec, strings[key][start:stop], outputs[key], start, stop) for key, spec in specs.items() for start, stop in blocks]
+                for future in futures: future.result()
+            return {key:self.__results(spec, outputs[key]) for key, spec in specs.items()}
+        with SharedArrays([(dtype, shape) for key in specs.keys() for name, dtype, shape in layouts[key]]) as shared:
+            positions = np.cumsum([0] + [len(layouts[key]) for key in specs.keys()])
+            shares = {key:shared.layouts[start:stop] for key, start, stop in zip(specs.keys(), positions[:-1], positions[1:])}
+            arrays = {key:shared.arrays[start:stop] for key, start, stop in zip(specs.keys(), positions[:-1], positions[1:])}
+            with ProcessPoolExecutor(max_workers=self.workers) as executor:
+                futures = [executor.submit(_shareddecode, spec, strings[key][start:stop], shares[key], start, stop) for key, spec in specs.items() for start, stop in blocks]
+                for future in futures: future.result()
+            return {key:self.__results(spec, [np.array(array) for array in arrays[key]]) for key, spec in specs.items()}
+
+    def encode(self, values, specs):
+        assert isinstance(values, Mapping) and isinstance(specs, Mapping)
+        specs = {key:spec for key, spec in specs.items() if key in values.keys()}
+        assert all([isinstance(spec, Spec) for spec in specs.values()])
+        inputs = {key:self.__inputs(spec, values[key]) for key, spec in specs.items()}
+        rows = {key:len(arrays[0]) for key, arrays in inputs.items()}
+        tasks = [(key, start, stop) for key in specs.keys() for start, stop in _blocks(rows[key], self.blocksize)]
+        if not self.parallel(sum(rows.values())):
+            with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                futures = [executor.submit(_encodeblock, specs[key], inputs[key], start, stop) for key, start, stop in tasks]
+                return self.__strings(specs, tasks, [future.result() for future in futures])
+        with SharedArrays([(array.dtype, array.shape) for key in specs.keys() for array in inputs[key]]) as shared:
+            for array, source in zip(shared.arrays, [array for key in specs.keys() for array in inputs[key]]): array[...] = source
+            positions = np.cumsum([0] + [len(inputs[key]) for key in specs.keys()])
+            shares = {key:shared.layouts[start:stop] for key, start, stop in zip(specs.keys(), positions[:-1], positions[1:])}
+            with ProcessPoolExecutor(max_workers=self.workers) as executor:
+                futures = [executor.submit(_sharedencode, specs[key], shares[key], start, stop) for key, start, stop in tasks]
+                return self.__strings(specs, tasks, [future.result() for future in futures])
+
+    @staticmethod
+    def __results(spec, outputs): return tuple(outputs) if spec.datatype == 'range' else outputs[0]
+    @staticmethod
+    def __inputs(spec, values):
+        if spec.datatype == 'range':
+            lowers, uppers = (values.lowers, values.uppers) if hasattr(values, 'lowers') else values
+            return [np.asarray(lowers, dtype=np.float64), np.asarray(uppers, dtype=np.float64)]
+        return [np.asarray(values, dtype=np.float64)]
+    @staticmethod
+    def __strings(specs, tasks, results):
+        strings = {key:[] for key in specs.keys()}
+        for (key, start, stop), result in zip(tasks, results): strings[key].append(np.asarray(result, dtype=object))
+        return {key:np.concatenate(items) if items else np.empty(0, dtype=object) for key, items in strings.items()}
+
+
+def specs_decodetable(dataframe, specs, *args, **kwargs): return SpecPool(*args, **kwargs).decode(dataframe, specs)
+def specs_encodetable(values, specs, *args, **kwargs): return SpecPool(*args, **kwargs).encode(values, specs)
+
+
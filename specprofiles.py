@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Oct 17 2026
+@name:   SpecProfiler Objects
+@author: Jack Kirby Cook
+
+"""
+
+import time
+import json
+from functools import update_wrapper
+from threading import RLock, local
+
+from specs.spec import Spec
+
+__version__ = "1.0.0"
+__author__ = "Jack Kirby Cook"
+__all__ = ['SpecProfiler']
+__copyright__ = "Copyright 2018, Jack Kirby Cook"
+__license__ = ""
+
+
+METHODS = ('asval', 'asstr', 'asvals', 'asstrs', 'operation', 'transformation', 'fromfile')
+CLASSMETHODS = ('fromfile',)
+VALUES = {'asvals':lambda args: _length(args[1]), 'asstrs':lambda args: _length(args[1])}
+
+_lock = RLock()
+_state = local()
+_profilers = []
+_originals = {}
+
+
+def _length(values):
+    try: return len(values)
+    except TypeError: return 1
+
+def _accumulate(counts, calls, seconds, values):
+    counts['calls'], counts['seconds'], counts['values'] = counts['calls'] + calls, counts['seconds'] + seconds, counts['values'] + values
+
+def _active():
+    if not hasattr(_state, 'methods'): _state.methods = set()
+    return _state.methods
+
+
+def _instrument(function, method, constructor):
+    def wrapper(*args, **kwargs):
+        active = _active()
+        if method in active: return function(*args, **kwargs)
+        active.add(method)
+        result, start = None, time.perf_counter()
+        try:
+            result = function(*args, **kwargs)
+            return result
+        finally:
+            elapsed = time.perf_counter() - start
+            active.discard(method)
+            spec = result if constructor else args[0]
+            datatype = spec.datatype if isinstance(spec, Spec) else kwargs.get('datatype', None)
+            name = spec.name if isinstance(spec, Spec) else None
+            values = VALUES.get(method, lambda args: 1)(args)
+            for profiler in list(_profilers): profiler.record(datatype, name, method, elapsed, values)
+    update_wrapper(wrapper, function)
+    return wrapper
+
+def _install():
+    for cls in [Spec, *Spec.registry().values()]:
+        for method in METHODS:
+            if method not in cls.__dict__ or (cls, method) in _originals: continue
+            original = cls.__dict__[method]
+            _originals[(cls, method)] = original
+            if method in CLASSMETHODS: setattr(cls, method, classmethod(_instrument(original.__func__, method, True)))
+            else: setattr(cls, method, _instrument(original, method, False))
+
+def _uninstall():
+    for (cls, method), original in _originals.items(): setattr(cls, method, original)
+    _originals.clear()
+
+
+class SpecProfiler(object):
+    def __init__(self, *args, **kwargs):
+        self.__records = {}
+        self.__lock = RLock()
+        self.__elapsed, self.__start = 0.0, None
+
+    def __repr__(self): return '{}(enabled={}, records={})'.format(self.__class__.__name__, self.enabled, len(self.__records))
+    def __enter__(self): return self.enable()
+    def __exit__(self, *args): self.disable()
+
+    @property
+    def enabled(self): return self in _profilers
+
+    def enable(self):
+        with _lock:
+            if self in _profilers: return self
+            if not _profilers: _install()
+            _profilers.append(self)
+            self.__start = time.perf_counter()
+        return self
+
+    def disable(self):
+        with _lock:
+            if self not in _profilers: return self
+            _profilers.remove(self)
+            if not _profilers: _uninstall()
+            self.__elapsed += time.perf_counter() - self.__start
+        return self
+
+    def record(self, datatype, name, method, seconds, values):
+        with self.__lock:
+            record = self.__records.setdefault((datatype, name, method), [0, 0.0, 0])
+            record[0], record[1], record[2] = record[0] + 1, record[1] + seconds, record[2] + values
+
+    def clear(self):
+        with self.__lock: self.__records.clear()
+
+    def snapshot(self):
+        with self.__lock: records = {key:tuple(values) for key, values in self.__records.items()}
+        snapshot = dict(methods={}, datatypes={}, specs={})
+        for (datatype, name, method), record in records.items():
+            _accumulate(snapshot['methods'].setdefault(method, dict(calls=0, seconds=0.0, values=0)), *record)
+            _accumulate(snapshot['datatypes'].setdefault(str(datatype), {}).setdefault(method, dict(calls=0, seconds=0.0, values=0)), *record)
+            _accumulate(snapshot['specs'].setdefault(str(name), {}).setdefault(method, dict(calls=0, seconds=0.0, values=0)), *record)
+        elapsed = self.__elapsed + (time.perf_counter() - self.__start if self.enabled else 0.0)
+        return dict(elapsed=elapsed, **snapshot)
+
+    def jsonstr(self): return json.dumps(self.snapshot(), sort_keys=True, indent=3, separators=(',', ' : '))
+    def tojson(self, file):
+        with open(file, 'w') as outfile: outfile.write(self.jsonstr())
+
+
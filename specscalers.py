@@ -0,0 +1,206 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Oct 17 2026
+@name:   SpecScaler Objects
+@author: Jack Kirby Cook
+
+"""
+
+import numpy as np
+from abc import ABC, abstractmethod
+
+__version__ = "1.0.0"
+__author__ = "Jack Kirby Cook"
+__all__ = ['SpecScaler', 'StandardScaler', 'MinMaxScaler', 'QuantileScaler', 'SCALERS']
+__copyright__ = "Copyright 2018, Jack Kirby Cook"
+__license__ = ""
+
+
+def _assamples(chunk, axis):
+    chunk = np.moveaxis(np.asarray(chunk, dtype=np.float64), axis, 0)
+    return chunk.reshape(chunk.shape[0], -1), chunk.shape[1:]
+
+def _fromsamples(samples, shape, axis): return np.moveaxis(samples.reshape(samples.shape[0], *shape), 0, axis)
+
+
+class SpecScaler(ABC):
+    __registry = {}
+    def __init_subclass__(cls, *args, how, **kwargs):
+        setattr(cls, 'how', how)
+        cls.__registry[how] = cls
+
+    def __init__(self, *args, axis=0, **kwargs):
+        self.__axis = axis
+        self.__shape = None
+
+    @property
+    def axis(self): return self.__axis
+    @property
+    def shape(self): return self.__shape
+    def __repr__(self): return '{}(axis={})'.format(self.__class__.__name__, self.axis)
+
+    @classmethod
+    def registry(cls): return cls.__registry
+    @classmethod
+    def fromdata(cls, data, *args, **kwargs):
+        assert data.method == 'scale'
+        return cls.__registry[data.how](*args, **kwargs)
+    @classmethod
+    def fromstate(cls, state):
+        state = dict(state)
+        instance = cls.__registry[state.pop('how')](axis=state.pop('axis'))
+        instance.__shape = tuple(state.pop('shape'))
+        instance.load(**{key:np.asarray(value) for key, value in state.items()})
+        return instance
+
+    def fit(self, chunk):
+        samples, shape = _assamples(chunk, self.axis)
+        if self.__shape is None: 
+            self.__shape = shape
+            self.initialize(samples.shape[1])
+        assert shape == self.__shape
+        self.update(samples)
+        return self
+
+    def transform(self, chunk):
+        samples, shape = _assamples(chunk, self.axis)
+        assert shape == self.__shape
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return _fromsamples(self.scale(samples), shape, self.axis)
+
+    def merge(self, other):
+        assert type(self) == type(other) and self.axis == other.axis
+        if other.shape is None: return self
+        if self.__shape is None: 
+            self.__shape = other.shape
+            self.initialize(int(np.prod(other.shape, dtype=int)))
+        assert self.__shape == other.shape
+        self.combine(other)
+        return self
+
+    def state(self): return dict(how=self.how, axis=self.axis, shape=list(self.shape), **self.save())
+    def fit_transform(self, chunk): return self.fit(chunk).transform(chunk)
+
+    @abstractmethod
+    def initialize(self, features): pass
+    @abstractmethod
+    def update(self, samples): pass
+    @abstractmethod
+    def combine(self, other): pass
+    @abstractmethod
+    def scale(self, samples): pass
+    @abstractmethod
+    def save(self): pass
+    @abstractmethod
+    def load(self, *args, **kwargs): pass
+
+
+class StandardScaler(SpecScaler, how='standardize'):
+    def __init__(self, *args, ddof=0, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.__ddof = ddof
+
+    @property
+    def count(self): return self.__count
+    @property
+    def mean(self): return self.__mean
+    @property
+    def variance(self): return self.__m2 / (self.__count - self.__ddof)
+    @property
+    def stdev(self): return np.sqrt(self.variance)
+
+    def initialize(self, features): self.__count, self.__mean, self.__m2 = np.zeros(features), np.zeros(features), np.zeros(features)
+    def update(self, samples):
+        count = np.sum(~np.isnan(samples), axis=0)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            mean = np.where(count > 0, np.nansum(samples, axis=0) / count, 0)
+        m2 = np.nansum((samples - mean) ** 2, axis=0)
+        self.__accumulate(count, mean, m2)
+    def combine(self, other): self.__accumulate(other.count, other.mean, other.__m2)
+
+    def __accumulate(self, count, mean, m2):
+        total = self.__count + count
+        delta = mean - self.__mean
+        with np.errstate(divide='ignore', invalid='ignore'):
+            self.__mean = np.where(total > 0, self.__mean + delta * count / total, 0)
+            self.__m2 = np.where(total > 0, self.__m2 + m2 + delta ** 2 * self.__count * count / total, 0)
+        self.__count = total
+
+    def scale(self, samples): return (samples - self.mean) / self.stdev
+    def save(self): return dict(count=self.__count, mean=self.__mean, m2=self.__m2, ddof=self.__ddof)
+    def load(self, *args, count, mean, m2, ddof, **kwargs):
+        self.initialize(len(count))
+        self.__count, self.__mean, self.__m2, self.__ddof = count, mean, m2, int(ddof)
+
+
+class MinMaxScaler(SpecScaler, how='minmax'):
+    @property
+    def minimum(self): return self.__minimum
+    @property
+    def maximum(self): return self.__maximum
+
+    def initialize(self, features): self.__minimum, self.__maximum = np.full(features, np.inf), np.full(features, -np.inf)
+    def update(self, samples):
+        if not len(samples): return
+        self.__minimum = np.fmin(self.__minimum, np.nanmin(np.where(np.isnan(samples), np.inf, samples), axis=0))
+        self.__maximum = np.fmax(self.__maximum, np.nanmax(np.where(np.isnan(samples), -np.inf, samples), axis=0))
+    def combine(self, other): self.__minimum, self.__maximum = np.fmin(self.__minimum, other.minimum), np.fmax(self.__maximum, other.maximum)
+
+    def scale(self, samples): return (samples - self.minimum) / (self.maximum - self.minimum)
+    def save(self): return dict(minimum=self.__minimum, maximum=self.__maximum)
+    def load(self, *args, minimum, maximum, **kwargs): self.__minimum, self.__maximum = minimum, maximum
+
+
+class QuantileScaler(SpecScaler, how='normalize'):
+    def __init__(self, *args, size=256, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.__size = int(size)
+
+    @property
+    def centroids(self): return self.__centroids
+    @property
+    def weights(self): return self.__weights
+
+    def initialize(self, features): self.__centroids, self.__weights = np.zeros((features, 0)), np.zeros((features, 0))
+    def update(self, samples):
+        samples = samples.T
+        self.__compress(np.concatenate([self.__centroids, samples], axis=1), np.concatenate([self.__weights, (~np.isnan(samples)).astype(np.float64)], axis=1))
+    def combine(self, other): self.__compress(np.concatenate([self.__centroids, other.centroids], axis=1), np.concatenate([self.__weights, other.weights], axis=1))
+
+    def __compress(self, centroids, weights):
+        centroids = np.where(weights > 0, np.nan_to_num(centroids), np.inf)
+        order = np.argsort(centroids, axis=1, kind='stable')
+        centroids, weights = np.take_along_axis(centroids, order, axis=1), np.take_along_axis(weights, order, axis=1)
+        if centroids.shape[1] <= self.__size:
+            self.__centroids, self.__weights = np.where(weights > 0, centroids, 0), weights
+            return
+        features = np.arange(centroids.shape[0])[:, np.newaxis]
+        totals = np.sum(weights, axis=1, keepdims=True)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            buckets = np.minimum(((np.cumsum(weights, axis=1) - weights / 2) / totals * self.__size).astype(np.int64), self.__size - 1)
+        indexes = (features * self.__size + np.where(weights > 0, buckets, 0)).ravel()
+        sums, counts = np.zeros(centroids.shape[0] * self.__size), np.zeros(centroids.shape[0] * self.__size)
+        np.add.at(sums, indexes, (np.where(weights > 0, centroids, 0) * weights).ravel())
+        np.add.at(counts, indexes, weights.ravel())
+        with np.errstate(divide='ignore', invalid='ignore'):
+            self.__centroids = np.where(counts > 0, sums / counts, 0).reshape(-1, self.__size)
+        self.__weights = counts.reshape(-1, self.__size)
+
+    def scale(self, samples):
+        results = np.full(samples.shape, np.nan)
+        for feature in range(samples.shape[1]):
+            mask = self.__weights[feature] > 0
+            centroids, weights = self.__centroids[feature][mask], self.__weights[feature][mask]
+            if not len(centroids): continue
+            ranks = (np.cumsum(weights) - weights / 2) / np.sum(weights)
+            values = samples[:, feature]
+            results[:, feature] = np.where(np.isnan(values), np.nan, np.interp(values, centroids, ranks, left=0, right=1))
+        return results
+
+    def save(self): return dict(centroids=self.__centroids, weights=self.__weights, size=self.__size)
+    def load(self, *args, centroids, weights, size, **kwargs): self.__centroids, self.__weights, self.__size = centroids, weights, int(size)
+
+
+SCALERS = SpecScaler.registry()
+
+
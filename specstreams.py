@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Oct 17 2026
+@name:   SpecStream Objects
+@author: Jack Kirby Cook
+
+"""
+
+import os.path
+import numpy as np
+import pandas as pd
+from collections.abc import Mapping
+
+from specs.spec import Spec
+
+__version__ = "1.0.0"
+__author__ = "Jack Kirby Cook"
+__all__ = ['SpecStream', 'specs_decode']
+__copyright__ = "Copyright 2018, Jack Kirby Cook"
+__license__ = ""
+
+
+CHUNKSIZE = 65536
+DECODERS = {
+    'num':lambda spec, strings: spec.asvals(strings)[0],
+    'range':lambda spec, strings: spec.asvals(strings)[0:2],
+    'category':lambda spec, strings: spec.asvals(strings)[0],
+    'histogram':lambda spec, strings: spec.asvals(strings)[0]}
+
+
+class SpecStream(object):
+    def __init__(self, specs, *args, chunksize=CHUNKSIZE, **kwargs):
+        assert isinstance(specs, Mapping) and all([isinstance(spec, Spec) for spec in specs.values()])
+        assert all([spec.datatype in DECODERS.keys() for spec in specs.values()])
+        assert isinstance(chunksize, int) and chunksize > 0
+        self.__specs, self.__chunksize = specs, chunksize
+
+    @property
+    def specs(self): return self.__specs
+    @property
+    def chunksize(self): return self.__chunksize
+    def __repr__(self): return '{}(specs={}, chunksize={})'.format(self.__class__.__name__, len(self.specs), self.chunksize)
+
+    def __call__(self, source, *args, **kwargs):
+        for chunk in self.chunks(source, *args, **kwargs): yield self.decode(chunk)
+
+    def chunks(self, source, *args, **kwargs):
+        if isinstance(source, str):
+            if not os.path.isfile(source): raise FileNotFoundError(source)
+            yield from pd.read_csv(source, *args, chunksize=self.chunksize, dtype=str, usecols=lambda column: column in self.specs, **kwargs)
+        else:
+            for chunk in source: yield chunk if isinstance(chunk, pd.DataFrame) else pd.DataFrame(chunk)
+
+    def decode(self, chunk):
+        strings = lambda key: np.asarray(chunk[key].values, dtype=object)
+        return {key:DECODERS[spec.datatype](spec, strings(key)) for key, spec in self.specs.items() if key in chunk.columns}
+
+
+def specs_decode(source, specs, *args, chunksize=CHUNKSIZE, **kwargs): return SpecStream(specs, chunksize=chunksize)(source, *args, **kwargs)
+
+
@@ -0,0 +1,15 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 2026
+@name:   Specs Test Configuration
+@author: Jack Kirby Cook
+
+"""
+
+import os.path
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if ROOT not in sys.path: sys.path.insert(0, ROOT)
+
+
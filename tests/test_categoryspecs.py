@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 2026
+@name:   CategorySpec Tests
+@author: Jack Kirby Cook
+
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from specs.spec import Spec
+from specs.specstreams import specs_decode
+from specs.specpools import specs_decodetable, specs_encodetable
+
+STRINGS = ['*', 'red|blue', 'green', 'blue|green', None, 'red']
+
+
+@pytest.fixture
+def spec(): return Spec.fromfile(data='colors', datatype='category', databasis=['red', 0, 'green', 1, 'blue', 2])
+
+
+def _members(spec, matrix): return [None if np.isnan(row).all() else {category for category, member in zip(spec.categories, row) if member} for row in matrix.tolist()]
+
+
+def test_asval_parity(spec):
+    expected = [None if string is None else set(spec.asval(string)) for string in STRINGS]
+    matrix, mask = spec.asvals(STRINGS)
+    assert _members(spec, matrix) == expected and mask.tolist() == [string is None for string in STRINGS]
+    dataframe = pd.DataFrame(dict(colors=STRINGS), dtype=object)
+    assert all([_members(spec, values['colors']) == expected for values in specs_decode([dataframe], dict(colors=spec))])
+    assert _members(spec, specs_decodetable(dataframe, dict(colors=spec), workers=2, blocksize=2)['colors']) == expected
+
+
+def test_asstr_parity(spec):
+    matrix, mask = spec.asvals(STRINGS)
+    strings, mask = spec.asstrs(matrix)
+    assert [None if string is np.nan else set(string.split('|')) for string in strings.tolist()] == [None if string is None else set(spec.asstr(spec.asval(string)).split('|')) for string in STRINGS]
+    assert specs_encodetable(dict(colors=matrix), dict(colors=spec), workers=2)['colors'].tolist() == strings.tolist()
+
+
+def test_unknown_labels(spec):
+    assert spec.validate(['red|pink'])[1]['membership'] == 1
+    with pytest.raises(ValueError): spec.asvals(['red|pink'])
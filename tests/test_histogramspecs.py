@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 2026
+@name:   HistogramSpec Tests
+@author: Jack Kirby Cook
+
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from specs.spec import Spec
+from specs.specstreams import specs_decode
+from specs.specpools import specs_decodetable
+
+
+@pytest.fixture
+def spec(): return Spec.fromfile(data='colors', datatype='histogram', databasis=['red', 0, 'green', 1, 'blue', 2])
+
+
+@pytest.mark.parametrize('strings, expected', [
+    ([], np.empty((0, 3))),
+    ([None], np.full((1, 3), np.nan)),
+    ([None, None], np.full((2, 3), np.nan)),
+    ([''], np.zeros((1, 3))),
+    (['', None], np.array([[0, 0, 0], [np.nan, np.nan, np.nan]]))])
+def test_empty_histograms(spec, strings, expected):
+    matrix, mask = spec.asvals(strings)
+    assert matrix.shape == expected.shape and np.array_equal(matrix, expected, equal_nan=True)
+    assert mask.tolist() == [string is None for string in strings]
+    assert [spec.asval(string) for string in strings if string is not None] == [dict(red=0.0, green=0.0, blue=0.0) for string in strings if string is not None]
+
+
+@pytest.mark.parametrize('strings', [[], [None], [None, '']])
+def test_empty_validation(spec, strings):
+    mask, summary = spec.validate(strings)
+    assert not mask.any() and summary['total'] == len(strings) and summary['nulls'] == strings.count(None) and summary['invalid'] == 0
+
+
+def test_null_chunks(spec):
+    dataframe = pd.DataFrame(dict(colors=[None, None, None]), dtype=object)
+    expected = np.full((3, 3), np.nan)
+    assert all([np.array_equal(values['colors'], expected, equal_nan=True) for values in specs_decode([dataframe], dict(colors=spec))])
+    assert np.array_equal(specs_decodetable(dataframe, dict(colors=spec), workers=2)['colors'], expected, equal_nan=True)
@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 2026
+@name:   Specs Import Tests
+@author: Jack Kirby Cook
+
+"""
+
+import os
+import sys
+import subprocess
+
+HEAVY = ('numpy', 'pandas', 'utilities.dataframes')
+BUDGET = 0.25
+
+
+def _subprocess(*args):
+    environment = dict(os.environ, PYTHONPATH=os.pathsep.join([path for path in sys.path if path]))
+    return subprocess.run([sys.executable, *args], env=environment, capture_output=True, text=True, check=True)
+
+
+def test_import_modules():
+    script = 'import sys, specs; print(",".join([name for name in {} if name in sys.modules]))'.format(repr(HEAVY))
+    assert _subprocess('-c', script).stdout.strip() == ''
+
+
+def test_import_time():
+    result = _subprocess('-X', 'importtime', '-c', 'import specs')
+    timings = [line.split('|') for line in result.stderr.splitlines() if line.startswith('import time:')]
+    cumulative = [int(cumulative) for own, cumulative, name in timings if name.strip() == 'specs'][0]
+    assert cumulative / 1e6 < BUDGET
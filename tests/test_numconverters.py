@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 2026
+@name:   NumConverter Tests
+@author: Jack Kirby Cook
+
+"""
+
+import numpy as np
+import pytest
+
+from specs.spec import SpecOperationNotSupportedError
+from specs.numspecs import NumSpec, RangeSpec
+
+
+@pytest.mark.parametrize('string, source, target, expected', [
+    ('12K $', dict(multiplier='K', precision=0), dict(multiplier='M', precision=3), '0.012M$'),
+    ('12345 $', dict(multiplier='', precision=0), dict(multiplier='K', precision=1), '12.3K$'),
+    ('1.5M $', dict(multiplier='M', precision=1), dict(multiplier='K', precision=0), '1500K$'),
+    ('50% $', dict(multiplier='%', precision=0), dict(multiplier='', precision=2), '0.50$')])
+def test_convert_roundtrip(string, source, target, expected):
+    source, target = NumSpec(data='income', unit='$', **source), NumSpec(data='income', unit='$', **target)
+    assert target.asstr(source.convert(source.asval(string), target)) == expected
+
+def test_convert_arrays():
+    source, target = NumSpec(data='income', unit='$', multiplier='K', precision=0), NumSpec(data='income', unit='$', multiplier='M', precision=2)
+    results = source.convert(np.array([12000., 1234567., np.nan]), target)
+    assert np.allclose(results, [10000., 1230000., np.nan], equal_nan=True)
+    assert source.converter(target) is source.converter(target)
+
+def test_convert_ranges():
+    source, target = RangeSpec(data='income', unit='$', multiplier='', precision=0), RangeSpec(data='income', unit='$', multiplier='K', precision=0)
+    lowers, uppers = source.convert((np.array([1200., 5000.]), np.array([2600., np.inf])), target)
+    assert np.array_equal(lowers, [1000., 5000.]) and np.array_equal(uppers, [3000., np.inf])
+
+def test_display_paths():
+    converter = NumSpec(data='income', unit='$', multiplier='K', precision=0).converter(NumSpec(data='income', unit='$', multiplier='M', precision=3))
+    assert np.allclose(converter.todisplay(np.array([12000.])), [0.012])
+    assert np.allclose(converter.fromdisplay(np.array([12.])), [12000.])
+    assert np.allclose(converter.rebase(np.array([12.])), [0.012])
+
+def test_convert_incompatible():
+    with pytest.raises(SpecOperationNotSupportedError):
+        NumSpec(data='income', unit='$', precision=0).converter(NumSpec(data='income', unit='%', precision=0))
+
+
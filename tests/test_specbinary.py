@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 2026
+@name:   SpecBinary Tests
+@author: Jack Kirby Cook
+
+"""
+
+import os
+import json
+import pytest
+from functools import partial
+
+from specs.speccatalog import specs_fromfile
+from specs.specbinary import specs_frombinary, binary_file, HEADER
+
+
+PARSERS = {'databasis':lambda item: json.loads(item) if isinstance(item, str) else item}
+
+
+@pytest.fixture
+def specs_file(tmp_path):
+    specs_file = tmp_path / 'specs.csv'
+    rows = ['income,income,num,"{""precision"": 0, ""multiplier"": ""K"", ""unit"": ""$""}"', 'color,color,category,"[""red"", 0, ""blue"", 1]"']
+    specs_file.write_text('\n'.join(['datakey,data,datatype,databasis', *rows]) + '\n')
+    return str(specs_file)
+
+
+def test_binary_roundtrip(specs_file):
+    specs = specs_fromfile(specs_file, PARSERS)
+    assert {key:spec.key for key, spec in specs_frombinary(specs_file, PARSERS).items()} == {key:spec.key for key, spec in specs.items()}
+
+
+def test_binary_parsers(specs_file):
+    specs_fromfile(specs_file, PARSERS)
+    assert specs_frombinary(specs_file, PARSERS) is not None
+    assert specs_frombinary(specs_file, {'databasis':lambda item: item}) is None
+    assert specs_frombinary(specs_file, {}) is None
+
+
+@pytest.mark.parametrize('corruption', [
+    lambda content: content[:HEADER.size + 16],
+    lambda content: content[:-3],
+    lambda content: content[:HEADER.size] + b'\xff' * (len(content) - HEADER.size)])
+def test_binary_corruption(specs_file, corruption):
+    specs_fromfile(specs_file, PARSERS)
+    with open(binary_file(specs_file), 'rb') as infile: content = infile.read()
+    with open(binary_file(specs_file), 'wb') as outfile: outfile.write(corruption(content))
+    assert specs_frombinary(specs_file, PARSERS) is None
+    assert set(specs_fromfile(specs_file, PARSERS).keys()) == {'income', 'color'}
+
+
+def _precise(item, precision):
+    basis = json.loads(item)
+    return dict(basis, precision=precision) if isinstance(basis, dict) else basis
+
+def _closure(precision): return lambda item: _precise(item, precision)
+def _default(item, precision=0): return _precise(item, precision)
+def _kwdefault(item, *, precision=0): return _precise(item, precision)
+
+
+@pytest.mark.parametrize('first, second', [
+    (_closure(0), _closure(2)),
+    (lambda item: _precise(item, 0), lambda item: _precise(item, 2)),
+    (partial(_default, precision=0), partial(_default, precision=2)),
+    (_default, lambda item, precision=2: _precise(item, precision)),
+    (_kwdefault, lambda item, *, precision=2: _precise(item, precision))])
+def test_binary_parser_state(specs_file, first, second):
+    assert specs_fromfile(specs_file, {'databasis':first})['income'].precision == 0
+    assert specs_fromfile(specs_file, {'databasis':second})['income'].precision == 2
+    assert specs_fromfile(specs_file, {'databasis':first})['income'].precision == 0
+
+
+def test_binary_parser_defaults(specs_file):
+    try:
+        _default.__defaults__ = (2,)
+        assert specs_fromfile(specs_file, {'databasis':_default})['income'].precision == 2
+    finally: _default.__defaults__ = (0,)
+    assert specs_fromfile(specs_file, {'databasis':_default})['income'].precision == 0
+
+
+class _Parser(object):
+    def __call__(self, item): return json.loads(item) if isinstance(item, str) else item
+
+
+def test_binary_parser_unknown(specs_file):
+    assert set(specs_fromfile(specs_file, {'databasis':_Parser()}).keys()) == {'income', 'color'}
+    assert not os.path.exists(binary_file(specs_file))
@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 2026
+@name:   SpecBins Tests
+@author: Jack Kirby Cook
+
+"""
+
+import numpy as np
+import pytest
+
+from specs.numspecs import RangeSpec
+from specs.specbins import SpecBins
+
+
+def _bins(generator, size):
+    edges = np.cumsum(generator.integers(1, 6, size=size * 2)).astype(np.float64)
+    lowers, uppers = edges[0::2], edges[1::2]
+    keep = generator.random(size) > 0.2
+    return lowers[keep], uppers[keep]
+
+def _values(generator, size, limit):
+    lowers = generator.integers(-2, limit + 2, size=size).astype(np.float64)
+    uppers = lowers + np.where(generator.random(size) < 0.2, 0, generator.integers(1, limit // 2, size=size))
+    return lowers, uppers
+
+def _contained(lower, upper, value, closed):
+    if lower == upper == value: return True
+    return lower <= value < upper if closed == 'left' else lower < value <= upper
+
+def _naive(lowers, uppers, lower, upper, closed):
+    if lower == upper: return next(iter([code for code in range(len(lowers)) if _contained(lowers[code], uppers[code], lower, closed)]), -1)
+    overlaps = [min(upper, uppers[code]) - max(lower, lowers[code]) for code in range(len(lowers))]
+    candidates = [code for code in range(len(lowers)) if overlaps[code] > 0]
+    return max(candidates, key=lambda code: (overlaps[code], -code)) if candidates else -1
+
+
+@pytest.mark.parametrize('seed', range(5))
+@pytest.mark.parametrize('closed', ['left', 'right'])
+def test_overlaps(seed, closed):
+    generator = np.random.default_rng(seed)
+    lowers, uppers = _bins(generator, 40)
+    spec = RangeSpec(data='income', precision=0)
+    bins = SpecBins(spec, spec.asstrs(lowers, uppers)[0].tolist(), closed=closed)
+    values = _values(generator, 400, int(uppers[-1]))
+    expected = [_naive(bins.lowers, bins.uppers, lower, upper, closed) for lower, upper in zip(*values)]
+    assert bins.overlaps(values).tolist() == expected
+
+
+@pytest.mark.parametrize('closed', ['left', 'right'])
+def test_bins(closed):
+    generator = np.random.default_rng(7)
+    lowers, uppers = _bins(generator, 20)
+    spec = RangeSpec(data='income', precision=0)
+    bins = SpecBins(spec, spec.asstrs(lowers, uppers)[0].tolist(), closed=closed)
+    values = generator.integers(0, int(uppers[-1]) + 2, size=200).astype(np.float64)
+    expected = [next(iter([code for code in range(len(bins)) if _contained(bins.lowers[code], bins.uppers[code], value, closed)]), -1) for value in values]
+    assert bins.bins(values).tolist() == expected
@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 2026
+@name:   SpecCatalog Tests
+@author: Jack Kirby Cook
+
+"""
+
+import json
+import pytest
+
+from specs.speccatalog import SpecConflictError, specs_fromfiles
+
+
+PARSERS = {'databasis':lambda item: json.loads(item) if isinstance(item, str) else item}
+
+
+def _catalog(directory, name, **databasis):
+    specs_file = directory / '{}.csv'.format(name)
+    databasis = json.dumps(dict(dict(precision=0, multiplier='K', unit='$'), **databasis)).replace('"', '""')
+    specs_file.write_text('datakey,data,datatype,databasis\nincome,income,num,"{}"\n'.format(databasis))
+    return str(specs_file)
+
+
+@pytest.mark.parametrize('databasis', [dict(multiplier='M'), dict(precision=2)])
+def test_formatting_conflicts(tmp_path, databasis):
+    specs_files = [_catalog(tmp_path, 'first'), _catalog(tmp_path, 'second', **databasis)]
+    with pytest.raises(SpecConflictError): specs_fromfiles(specs_files, PARSERS, cache=False)
+    merged, timings = specs_fromfiles(specs_files, PARSERS, cache=False, conflicts='last')
+    assert str(merged['income'].multiplier) == databasis.get('multiplier', 'K') and merged['income'].precision == databasis.get('precision', 0)
+
+
+def test_identical_specs(tmp_path):
+    specs_files = [_catalog(tmp_path, 'first'), _catalog(tmp_path, 'second')]
+    merged, timings = specs_fromfiles(specs_files, PARSERS, cache=False)
+    assert list(merged.keys()) == ['income'] and set(timings.keys()) == set(specs_files)
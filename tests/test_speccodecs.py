@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 2026
+@name:   SpecCodec Tests
+@author: Jack Kirby Cook
+
+"""
+
+import pytest
+
+from specs.spec import Spec
+from specs.numspecs import NumSpec, _numfromstr
+from specs.speccodecs import SpecCodec
+
+
+@pytest.mark.parametrize('first, second', [(0, -0.0), (0.0, -0.0), (1, 1.0), (True, 1), ((0.0, 1.0), (-0.0, 1.0))])
+def test_value_keys(first, second):
+    codec = SpecCodec(str, repr, size=16)
+    assert codec.asstr(first) == repr(first) and codec.asstr(second) == repr(second)
+    assert codec.asstr(first) == repr(first)
+
+
+def test_value_memo():
+    calls = []
+    codec = SpecCodec(str, lambda value: calls.append(value) or repr(value), size=16)
+    assert [codec.asstr(value) for value in (1.5, 1.5, -0.0, -0.0)] == ['1.5', '1.5', '-0.0', '-0.0']
+    assert calls == [1.5, -0.0]
+
+
+def test_unmemoized_binding():
+    spec = NumSpec(data='income', precision=0, multiplier='K', unit='$')
+    assert spec.valdecoder() is _numfromstr and spec.asval('12K $') == 12000
+    spec.codec(size=16)
+    assert spec.asval('12K $') == spec.asval('12K $') == 12000 and spec.codec().stats()['asval']['hits'] == 1
+    spec.codec(size=0)
+    assert spec.valdecoder() is _numfromstr
+
+
+def test_histogram_memo():
+    spec = Spec.fromfile(data='colors', datatype='histogram', databasis=['red', 0, 'blue', 1])
+    codec = spec.codec(size=16)
+    assert codec.size == 0 and codec.asval('red=1|blue=2') == dict(red=1.0, blue=2.0)
+    assert codec.stats()['asval']['misses'] == 0
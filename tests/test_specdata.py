@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 2026
+@name:   SpecData Tests
+@author: Jack Kirby Cook
+
+"""
+
+import gc
+import json
+import pytest
+import pandas as pd
+
+from specs.spec import Spec
+from specs.numspecs import NumSpec
+from specs.specengine import SpecEngine
+from specs.specdata import DataName, DataOperation, data_operation, data_transformation, data_tojson, data_fromjson
+
+
+@pytest.mark.parametrize('data, other, expected', [
+    ('a', 'b', 'a*b'),
+    ('a_b', 'c', '(a_b)*(c)'),
+    ('a', 'b_c', 'a*b_c'),
+    ('a_b', 'c_d', '(a_b)*(c_d)')])
+def test_rendering(data, other, expected):
+    assert str(data_operation(data, other, method='multiply')) == expected
+
+
+def test_structural_equality():
+    data = data_operation('income', 'households', method='divide')
+    assert data == data_operation('income', 'households', method='divide')
+    assert data != DataName(str(data)) and data != str(data)
+    assert DataName('income') == 'income' and hash(DataName('income')) == hash('income')
+
+
+def test_lazy_rendering():
+    data = data_operation('income', 'households', method='divide')
+    hash(data), data == data_operation('income', 'households', method='divide')
+    assert data._SpecData__string is None
+
+
+@pytest.mark.parametrize('data', [
+    DataName('income'),
+    data_operation('income', 'households', method='divide'),
+    data_transformation(data_operation('income', 'households', method='divide'), method='moving', how='average', period=3),
+    data_transformation('income', method='wtreduction', how='average', axis='age')])
+def test_json_data(data):
+    assert data_fromjson(json.loads(json.dumps(data_tojson(data), sort_keys=True))) == data
+
+
+def test_json_roundtrip(tmp_path):
+    spec = NumSpec(data='income', precision=0) / NumSpec(data='households', precision=0)
+    spec.tojson(str(tmp_path / 'spec.json'))
+    key = spec.key
+    del spec
+    gc.collect()
+    loaded = Spec.fromjson(str(tmp_path / 'spec.json'))
+    assert isinstance(loaded.data, DataOperation) and loaded.key == key
+    dataframe = pd.DataFrame(dict(income=[10.0, 20.0], households=[2.0, 4.0]))
+    assert SpecEngine(dataframe).evaluate(loaded.data).tolist() == [5.0, 5.0]
@@ -0,0 +1,29 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 2026
+@name:   Spec Derivation Tests
+@author: Jack Kirby Cook
+
+"""
+
+import pytest
+
+from specs.numspecs import NumSpec
+
+
+@pytest.fixture
+def spec(): return NumSpec(data='income', precision=0)
+
+
+@pytest.mark.parametrize('first, second', [(2, 2.0), (1, True), (2.0, 2)])
+def test_factor_types(spec, first, second):
+    derived, other = spec.multiply(first), spec.multiply(second)
+    assert derived is not other and derived.key != other.key
+    assert str(derived.data) == '{}*income'.format(first) and str(other.data) == '{}*income'.format(second)
+    assert spec.multiply(first) is derived and spec.multiply(second) is other
+
+
+def test_moving_types(spec):
+    derived, other = spec.moving(how='average', period=12), spec.moving(how='average', period=12.0)
+    assert derived.key != other.key
+    assert str(derived.data) == '12mavg|income' and str(other.data) == '12.0mavg|income'
@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 2026
+@name:   Spec Interning Tests
+@author: Jack Kirby Cook
+
+"""
+
+import gc
+
+from specs.spec import Spec
+from specs.numspecs import NumSpec
+
+
+def test_interned_arguments():
+    spec = NumSpec(data='income', precision=0, multiplier='K', unit='$')
+    assert NumSpec(data='income', precision=0, multiplier='K', unit='$') is spec
+    assert Spec(data='income', datatype='num', precision=0, multiplier='K', unit='$') is spec
+    assert NumSpec(**spec.todict()) is spec
+    assert NumSpec(data='income', precision=1, multiplier='K', unit='$') is not spec
+
+
+def test_interned_initialization(monkeypatch):
+    spec = NumSpec(data='income', precision=0, multiplier='K', unit='$')
+    calls = []
+    initialize = NumSpec.__init__
+    monkeypatch.setattr(NumSpec, '__init__', lambda self, *args, **kwargs: calls.append(kwargs) or initialize(self, *args, **kwargs))
+    assert NumSpec(data='income', precision=0, multiplier='K', unit='$') is spec and not calls
+    assert NumSpec(data='income', precision=2, multiplier='K', unit='$') is not spec and len(calls) == 1
+
+
+def test_interned_collection():
+    key = NumSpec(data='wealth', precision=0, multiplier='K', unit='$').key
+    gc.collect()
+    assert key not in Spec.interned()
+    spec = NumSpec(data='wealth', precision=0, multiplier='K', unit='$')
+    assert spec.key == key and Spec.interned()[key] is spec
@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 2026
+@name:   SpecPool Tests
+@author: Jack Kirby Cook
+
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from specs.spec import Spec
+from specs.specpools import SpecPool
+from specs.specstreams import SpecStream
+
+ROWS = 257
+
+
+@pytest.fixture
+def specs():
+    categories = ['red', 0, 'green', 1, 'blue', 2]
+    return dict(
+        income=Spec.fromfile(data='income', datatype='num', databasis=dict(precision=0, multiplier='K', unit='$')),
+        ages=Spec.fromfile(data='ages', datatype='range', databasis=dict(precision=0, multiplier='', unit='')),
+        colors=Spec.fromfile(data='colors', datatype='category', databasis=categories),
+        counts=Spec.fromfile(data='counts', datatype='histogram', databasis=categories))
+
+
+@pytest.fixture
+def dataframe():
+    generator = np.random.default_rng(0)
+    nums = generator.integers(1, 100, size=ROWS)
+    nulls = generator.random(ROWS) < 0.1
+    income = ['{}K $'.format(num) for num in nums]
+    ages = ['{}|{}'.format(num, num + 5) if num % 3 else '>{}'.format(num) for num in nums]
+    colors = [['red', 'green|blue', '*', 'blue'][num % 4] for num in nums]
+    counts = ['red={}|blue={}'.format(num, num % 7) for num in nums]
+    columns = dict(income=income, ages=ages, colors=colors, counts=counts)
+    return pd.DataFrame({key:[None if null else value for value, null in zip(values, nulls)] for key, values in columns.items()}, dtype=object)
+
+
+def _equal(values, others):
+    if isinstance(values, tuple): return all([_equal(value, other) for value, other in zip(values, others)])
+    return np.array_equal(np.asarray(values, dtype=np.float64), np.asarray(others, dtype=np.float64), equal_nan=True)
+
+
+@pytest.mark.parametrize('workers, threshold', [(1, 1), (3, 10 ** 9), (2, 1)])
+def test_decode(specs, dataframe, workers, threshold):
+    serial = SpecStream(specs).decode(dataframe)
+    pooled = SpecPool(workers=workers, blocksize=32, threshold=threshold).decode(dataframe, specs)
+    assert set(pooled.keys()) == set(serial.keys())
+    assert all([_equal(pooled[key], serial[key]) for key in specs.keys()])
+
+
+@pytest.mark.parametrize('workers, threshold', [(3, 10 ** 9), (2, 1)])
+def test_encode(specs, dataframe, workers, threshold):
+    pool = SpecPool(workers=workers, blocksize=32, threshold=threshold)
+    values = pool.decode(dataframe, specs)
+    strings = pool.encode(values, specs)
+    expected = {key:spec.asstrs(*(values[key] if isinstance(values[key], tuple) else (values[key],)))[0] for key, spec in specs.items()}
+    assert all([pd.Series(strings[key]).equals(pd.Series(expected[key])) for key in specs.keys()])
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 2026
+@name:   SpecScaler Tests
+@author: Jack Kirby Cook
+
+"""
+
+import numpy as np
+import pytest
+
+from specs.specscalers import SpecScaler, StandardScaler, MinMaxScaler, QuantileScaler
+
+
+@pytest.fixture
+def chunks():
+    generator = np.random.default_rng(0)
+    chunks = [generator.normal(loc, 2.0, size=(rows, 3)) for loc, rows in ((1.0, 50), (4.0, 120), (-2.0, 1), (0.0, 75))]
+    for chunk in chunks[:2]: chunk[generator.random(chunk.shape) < 0.1] = np.nan
+    return chunks
+
+
+def _merged(scaler, chunks):
+    merged = scaler()
+    for chunk in chunks: merged.merge(scaler().fit(chunk))
+    return merged
+
+
+@pytest.mark.parametrize('ddof', [0, 1])
+def test_standard_merge(chunks, ddof):
+    values = np.concatenate(chunks)
+    merged = _merged(lambda: StandardScaler(ddof=ddof), chunks)
+    assert np.allclose(merged.count, np.sum(~np.isnan(values), axis=0))
+    assert np.allclose(merged.mean, np.nanmean(values, axis=0)) and np.allclose(merged.variance, np.nanvar(values, axis=0, ddof=ddof))
+    assert np.allclose(merged.transform(values), StandardScaler(ddof=ddof).fit_transform(values), equal_nan=True)
+
+
+def test_minmax_merge(chunks):
+    values = np.concatenate(chunks)
+    merged = _merged(MinMaxScaler, chunks)
+    assert np.array_equal(merged.minimum, np.nanmin(values, axis=0)) and np.array_equal(merged.maximum, np.nanmax(values, axis=0))
+    assert np.allclose(merged.transform(values), MinMaxScaler().fit_transform(values), equal_nan=True)
+
+
+def test_quantile_merge(chunks):
+    values = np.concatenate(chunks)
+    merged, fitted = _merged(lambda: QuantileScaler(size=1024), chunks), QuantileScaler(size=1024).fit(values)
+    assert np.allclose(np.sort(merged.centroids, axis=1), np.sort(fitted.centroids, axis=1)) and np.allclose(np.sum(merged.weights, axis=1), np.sum(fitted.weights, axis=1))
+    assert np.allclose(merged.transform(values), fitted.transform(values), equal_nan=True)
+
+
+def test_quantile_compression(chunks):
+    values = np.concatenate(chunks)
+    merged = _merged(lambda: QuantileScaler(size=32), chunks)
+    ranks = merged.transform(values)
+    expected = np.stack([np.where(np.isnan(column), np.nan, (np.argsort(np.argsort(column)) + 0.5) / np.sum(~np.isnan(column))) for column in values.T], axis=1)
+    assert np.nanmax(np.abs(ranks - expected)) < 0.05
+
+
+@pytest.mark.parametrize('scaler', [StandardScaler, MinMaxScaler, lambda: QuantileScaler(size=32)])
+def test_state_roundtrip(chunks, scaler):
+    fitted = _merged(scaler, chunks)
+    values = np.concatenate(chunks)
+    assert np.allclose(SpecScaler.fromstate(fitted.state()).transform(values), fitted.transform(values), equal_nan=True)
@@ -6,7 +6,14 @@ Created on Fri Apr 12 2018
 
 """
 
+from functools import reduce
+
+from utilities.dispatchers import keyword_singledispatcher as keyworddispatcher
+
+from specs.speclazy import LazyModule
 from specs.spec import Spec, SpecOperationNotSupportedError, SpecTransformationNotSupportedError
+from specs.speckernels import WTREDUCTION
+from specs.numspecs import _asseries, _likeitems
 
 __version__ = "1.0.0"
 __author__ = "Jack Kirby Cook"
@@ -15,34 +22,149 @@ __copyright__ = "Copyright 2018, Jack Kirby Cook"
 __license__ = ""
 
 
+np = LazyModule('numpy', owner=__name__, alias='np')
+pd = LazyModule('pandas', owner=__name__, alias='pd')
+
 ALL = '*'
 DELIMITER = '|'
-ASSIGNMENT = '@'
+ASSIGNMENT = '='
 
 _aslist = lambda items: [items] if not isinstance(items, (list, tuple, set)) else list(items)
+_iscategorical = lambda items: isinstance(getattr(items, 'dtype', None), pd.CategoricalDtype)
+_countstr = lambda count: '0' if count != count else str(int(count)) if float(count) % 1 == 0 else str(float(count))
+
+
+def _encode(labels, categories, indexes):
+    if _iscategorical(labels): 
+        labels = pd.Categorical(labels)
+        positions = np.append(categories.get_indexer(labels.categories), -1)[labels.codes]
+    else: positions = categories.get_indexer(np.asarray(labels, dtype=object).ravel())
+    mask = positions < 0
+    codes = np.where(mask, -1, indexes[positions])
+    return codes, mask
+
+def _decode(codes, indexes, categories):
+    codes = np.asarray(codes, dtype=np.float64).ravel()
+    positions = indexes.get_indexer(np.nan_to_num(codes, nan=-1).astype(np.int64))
+    positions[np.isnan(codes)] = -1
+    return pd.Categorical.from_codes(positions, categories=categories)
+
+def _histogramsfromstrs(histogramstrs, categories):
+    histogramstrs = _asseries(histogramstrs)
+    notnull = histogramstrs.notnull().values
+    matrix = np.full((len(histogramstrs), len(categories)), np.nan, dtype=np.float64)
+    matrix[notnull] = 0
+    items = histogramstrs[notnull].astype(str).str.split(DELIMITER).explode()
+    items = items[items.str.len() > 0]
+    if items.empty: return matrix, ~notnull
+    assignments = items.str.partition(ASSIGNMENT)
+    positions = categories.get_indexer(assignments[0].values)
+    if (positions < 0).any(): raise ValueError(assignments[0][positions < 0].unique().tolist())
+    matrix[items.index.values, positions] = pd.to_numeric(assignments[2]).values
+    return matrix, ~notnull
+
+def _categoriesmembership(labels, categories, indexes):
+    labels = _asseries(labels)
+    nulls = labels.isnull().values
+    membership = np.zeros(len(labels), dtype=bool)
+    if np.asarray(labels.dropna().tolist()).dtype.kind in 'iuf': membership[~nulls] = indexes.get_indexer(labels[~nulls].astype(np.int64).values) < 0
+    else:
+        labels = labels[~nulls].astype(str)
+        items = labels[labels != ALL].str.split(DELIMITER).explode()
+        membership[items.index.values[categories.get_indexer(items.values) < 0]] = True
+    return nulls, dict(membership=membership)
+
+def _categoriesfromstrs(labels, categories):
+    labels = _asseries(labels)
+    notnull = labels.notnull().values
+    matrix = np.full((len(labels), len(categories)), np.nan, dtype=np.float64)
+    matrix[notnull] = 0
+    labels = labels[notnull].astype(str)
+    matrix[labels.index.values[(labels == ALL).values]] = 1
+    items = labels[labels != ALL].str.split(DELIMITER).explode()
+    if items.empty: return matrix, ~notnull
+    positions = categories.get_indexer(items.values)
+    if (positions < 0).any(): raise ValueError(items[positions < 0].unique().tolist())
+    matrix[items.index.values, positions] = 1
+    return matrix, ~notnull
+
+def _categorystrsformatting(matrix, categories):
+    matrix = np.asarray(matrix, dtype=np.float64)
+    assert matrix.ndim == 2 and matrix.shape[1] == len(categories)
+    mask = np.isnan(matrix).all(axis=1)
+    members = np.nan_to_num(matrix) > 0
+    labels = [np.where(members[:, position], category + DELIMITER, '') for position, category in enumerate(categories)]
+    labelstrs = np.char.rstrip(reduce(np.char.add, labels, np.full(len(matrix), '', dtype=str)), DELIMITER).astype(object)
+    labelstrs[mask] = np.nan
+    return labelstrs, mask
+
+def _histogramsvalidation(histogramstrs, categories):
+    histogramstrs = _asseries(histogramstrs)
+    nulls = histogramstrs.isnull().values
+    membership, unparsable, negative = [np.zeros(len(histogramstrs), dtype=bool) for _ in range(3)]
+    items = histogramstrs[~nulls].astype(str).str.split(DELIMITER).explode()
+    items = items[items.str.len() > 0]
+    if items.empty: return nulls, dict(membership=membership, unparsable=unparsable, negative=negative)
+    assignments = items.str.partition(ASSIGNMENT)
+    counts = pd.to_numeric(assignments[2], errors='coerce').values
+    membership[items.index.values[categories.get_indexer(assignments[0].values) < 0]] = True
+    unparsable[items.index.values[(assignments[1] != ASSIGNMENT).values | np.isnan(counts)]] = True
+    negative[items.index.values[counts < 0]] = True
+    return nulls, dict(membership=membership, unparsable=unparsable, negative=negative)
+
+def _histogramstrsformatting(matrix, categories):
+    matrix = np.asarray(matrix, dtype=np.float64)
+    assert matrix.ndim == 2 and matrix.shape[1] == len(categories)
+    mask = np.isnan(matrix).all(axis=1)
+    counts = np.nan_to_num(matrix)
+    countstrs = np.where(counts % 1 == 0, np.char.mod('%d', counts), np.char.mod('%s', counts))
+    assignments = [np.char.add(category + ASSIGNMENT, countstrs[:, position]) for position, category in enumerate(categories)]
+    histogramstrs = reduce(lambda strs, others: np.char.add(np.char.add(strs, DELIMITER), others), assignments).astype(object)
+    histogramstrs[mask] = np.nan
+    return histogramstrs, mask
 
 
 class CategorySpec(Spec, datatype='category'):
+    __slots__ = ('__categories', '__indexes', '__categoryindexes', '__indexcategories')
+    __hash__ = Spec.__hash__
+
     @property
     def categories(self): return self.__categories
     @property
     def indexes(self): return self.__indexes
+    @property
+    def __categoryarray(self): return self.cached('categoryarray', lambda: pd.Index(self.__categories))
+    @property
+    def __indexarray(self): return self.cached('indexarray', lambda: pd.Index(self.__indexes, dtype=np.int64))
     
-    def __hash__(self): return hash((self.data, self.datatype, self.categories, self.indexes,))
+    @property
+    def hashkey(self): return (self.data, self.datatype, self.categories, self.indexes,)
     def __eq__(self, other): 
+        if self is other: return True
         if type(self) != type(other): raise TypeError(type(other).__name__)
         if all([self.data != other.data, self.datatype != other.datatype]): raise TypeError(type(other).__name__)
         return self.categories == other.categories and self.indexes == other.indexes 
     
-    def category(self, index): return self.categories[self.indexes.index(index)]
-    def index(self, category): return self.indexes[self.categories.index(category)]
+    def category(self, index): return self.__indexcategories[index]
+    def index(self, category): return self.__categoryindexes[category]
+
+    def encode(self, labels): 
+        codes, mask = _encode(labels, self.__categoryarray, self.__indexarray.values)
+        return _likeitems(codes, labels), _likeitems(mask, labels)
+    def decode(self, codes): return _likeitems(_decode(codes, self.__indexarray, self.__categoryarray), codes)
+    def validations(self, values): return _categoriesmembership(values, self.__categoryarray, self.__indexarray)
     def todict(self): return dict(**super().todict(), categories=self.categories, indexes=self.indexes)       
+
+    def asvals(self, labels): return _categoriesfromstrs(labels, self.__categoryarray)
+    def asstrs(self, matrix): return _categorystrsformatting(matrix, self.__categories)
        
     def __init__(self, *args, categories, indexes, **kwargs): 
         assert isinstance(categories, (tuple, list)) and isinstance(indexes, (tuple, list))
         assert len(set(categories)) == len(categories) == len(set(indexes)) == len(indexes) 
         self.__categories = tuple(categories) 
         self.__indexes = tuple([int(index) for index in indexes])
+        self.__categoryindexes = {category:index for category, index in zip(self.__categories, self.__indexes)}
+        self.__indexcategories = {index:category for category, index in zip(self.__categories, self.__indexes)}
         super().__init__(*args, **kwargs)
 
     def asval(self, string):
@@ -51,7 +173,7 @@ class CategorySpec(Spec, datatype='category'):
         else: return tuple(string.split(DELIMITER))        
 
     def asstr(self, value): 
-        assert all([item in self.__categories for item in _aslist(value)])
+        assert all([item in self.__categoryindexes for item in _aslist(value)])
         return DELIMITER.join(_aslist(value))
         
     @classmethod
@@ -82,19 +204,33 @@ class CategorySpec(Spec, datatype='category'):
 
 
 class HistogramSpec(Spec, datatype='histogram'):
+    __slots__ = ('__categories', '__indexes', '__categoryindexes', '__indexcategories')
+    __hash__ = Spec.__hash__
+
     @property
     def categories(self): return self.__categories
     @property
     def indexes(self): return self.__indexes
+    @property
+    def __categoryarray(self): return self.cached('categoryarray', lambda: pd.Index(self.__categories))
+    @property
+    def __indexarray(self): return self.cached('indexarray', lambda: pd.Index(self.__indexes, dtype=np.int64))
 
-    def __hash__(self): return hash((self.data, self.datatype, self.categories, self.indexes,))
+    @property
+    def hashkey(self): return (self.data, self.datatype, self.categories, self.indexes,)
     def __eq__(self, other): 
+        if self is other: return True
         if type(self) != type(other): raise TypeError(type(other))
         if all([self.data != other.data, self.datatype != other.datatype]): raise TypeError(type(other))
         return self.categories == other.categories and self.indexes == other.indexes 
     
-    def category(self, index): return self.categories[self.indexes.index(index)]
-    def index(self, category): return self.indexes[self.categories.index(category)]
+    def category(self, index): return self.__indexcategories[index]
+    def index(self, category): return self.__categoryindexes[category]
+
+    def encode(self, labels): 
+        codes, mask = _encode(labels, self.__categoryarray, self.__indexarray.values)
+        return _likeitems(codes, labels), _likeitems(mask, labels)
+    def decode(self, codes): return _likeitems(_decode(codes, self.__indexarray, self.__categoryarray), codes)
     def todict(self): return dict(**super().todict(), categories=self.categories, indexes=self.indexes)  
     
     def __init__(self, *args, categories, indexes, **kwargs): 
@@ -102,16 +238,34 @@ class HistogramSpec(Spec, datatype='histogram'):
         assert len(set(categories)) == len(categories) == len(set(indexes)) == len(indexes)   
         self.__categories = tuple(categories) 
         self.__indexes = tuple([int(index) for index in indexes])
+        self.__categoryindexes = {category:index for category, index in zip(self.__categories, self.__indexes)}
+        self.__indexcategories = {index:category for category, index in zip(self.__categories, self.__indexes)}
         super().__init__(*args, **kwargs)
     
     def asval(self, string):
         assert isinstance(string, str)
-        items = {item.split('=')[0]:item.split[1] for item in string.split(DELIMITER)}
-        return {category:items.get(category, 0) for category in self.__categories}
+        counts = {category:0.0 for category in self.__categories}
+        assignments = [item.partition(ASSIGNMENT) for item in string.split(DELIMITER) if item]
+        unknown = [category for category, assignment, count in assignments if category not in self.__categoryindexes]
+        if unknown: raise ValueError(unknown)
+        counts.update({category:float(count) for category, assignment, count in assignments})
+        return counts
     
     def asstr(self, value): 
-        assert all([key in self.__categories for key in value.keys()])
-        return DELIMITER.join([ASSIGNMENT.join([key, value]) for key, value in self.items()])
+        assert all([key in self.__categoryindexes for key in value.keys()])
+        counts = [value.get(category, 0) for category in self.__categories]
+        if all([count != count for count in counts]): return np.nan
+        return DELIMITER.join([ASSIGNMENT.join([category, _countstr(count)]) for category, count in zip(self.__categories, counts)])
+
+    def codec(self, *args, **kwargs): return super().codec(*args, size=0)
+    def asvals(self, strings): return _histogramsfromstrs(strings, self.__categoryarray)
+    def asstrs(self, matrix): return _histogramstrsformatting(matrix, self.__categories)
+
+    def validations(self, values):
+        if _iscategorical(values) or np.asarray(values.values if isinstance(values, pd.Series) else values).ndim == 1: return _histogramsvalidation(values, self.__categoryarray)
+        matrix = np.asarray(values, dtype=np.float64)
+        if matrix.ndim != 2 or matrix.shape[1] != len(self.categories): raise ValueError(matrix.shape)
+        return np.isnan(matrix).all(axis=1), dict(negative=(matrix < 0).any(axis=1))
 
     @classmethod
     def fromfile(cls, *args, databasis=[], **kwargs):
@@ -128,8 +282,25 @@ class HistogramSpec(Spec, datatype='histogram'):
         if other != self: raise SpecOperationNotSupportedError(self, other, 'subtract') 
         return self.operation(other, *args, method='subtract', **kwargs)
 
+    # TRANSFORMATIONS
+    @keyworddispatcher('how')
+    def wtreduction(self, *args, how, **kwargs): raise KeyError(how)
+    @wtreduction.register('average')
+    def __wtaverage(self, rangespec, *args, how, **kwargs): return self.__wtreduction(rangespec, *args, how='average', **kwargs)
+    @wtreduction.register('stdev')
+    def __wtstdev(self, rangespec, *args, how, **kwargs): return self.__wtreduction(rangespec, *args, how='stdev', **kwargs)
+    @wtreduction.register('median')
+    def __wtmedian(self, rangespec, *args, how, **kwargs): return self.__wtreduction(rangespec, *args, how='median', **kwargs)
 
+    def __wtreduction(self, rangespec, *args, how, **kwargs):
+        if rangespec.datatype != 'range': raise SpecTransformationNotSupportedError(self, 'wtreduction', how)
+        formatting = dict(precision=rangespec.precision, multiplier=rangespec.multiplier, unit=rangespec.unit, heading=rangespec.heading, numdirection='state')
+        formatting.update(kwargs)
+        return self.transformation(*args, datatype='num', method='wtreduction', how=how, **formatting)
 
-
+    def wtreduce(self, matrix, rangespec, *args, how, weight=0.5, **kwargs):
+        lowers, uppers, directions = rangespec.asvals(list(self.categories))
+        values = WTREDUCTION[how](np.asarray(matrix, dtype=np.float64), lowers, uppers, weight=weight, axis=-1)
+        return values, self.wtreduction(rangespec, *args, how=how, **kwargs)
 
 